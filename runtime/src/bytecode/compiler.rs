@@ -150,6 +150,7 @@ impl Compiler {
         match &mut self.chunk.code[offset] {
             Instruction::Jump(ref mut target) => *target = jump_distance as i32,
             Instruction::JumpIfFalse(ref mut target) => *target = jump_distance as i32,
+            Instruction::CountDown(_, ref mut target) => *target = jump_distance as i32,
             Instruction::PushTryHandler(ref mut target) => *target = jump_distance as u32,
             _ => return Err(CompilerError::InvalidJumpTarget),
         }
@@ -310,15 +311,9 @@ impl Compiler {
 
                 let loop_start = self.current_offset();
 
-                // Load counter and check if > 0
-                self.emit(Instruction::LoadLocal(counter_idx));
-                let zero_idx = self.add_constant(Constant::Number(0.0))?;
-                self.emit(Instruction::LoadConst(zero_idx));
-                self.emit(Instruction::Greater);
-
-                // Jump to end if false
+                // Decrement the counter, or jump to end once it reaches zero
                 let exit_jump = self.current_offset();
-                self.emit(Instruction::JumpIfFalse(0)); // Placeholder
+                self.emit(Instruction::CountDown(counter_idx, 0)); // Placeholder
 
                 // Loop body
                 self.context.enter_scope();
@@ -327,13 +322,6 @@ impl Compiler {
                 }
                 self.context.exit_scope();
 
-                // Decrement counter
-                self.emit(Instruction::LoadLocal(counter_idx));
-                let one_idx = self.add_constant(Constant::Number(1.0))?;
-                self.emit(Instruction::LoadConst(one_idx));
-                self.emit(Instruction::Subtract);
-                self.emit(Instruction::StoreLocal(counter_idx));
-
                 // Jump back to start
                 let loop_distance = self.current_offset() - loop_start + 1;
                 self.emit(Instruction::Loop(loop_distance as i32));
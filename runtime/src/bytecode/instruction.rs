@@ -122,6 +122,11 @@ pub enum Instruction {
     /// Operand: instruction offset (i32, negative)
     Loop(i32),
 
+    /// Count down a loop counter held in a local variable
+    /// Decrements the counter while it is positive, otherwise jumps past the loop
+    /// Operands: local variable index (u32), jump offset (i32)
+    CountDown(u32, i32),
+
     // === Functions ===
     /// Call a function with N arguments
     /// Stack: [... function arg1 arg2 ... argN] -> [... result]
@@ -243,6 +248,9 @@ impl Instruction {
             // Instructions with i32 operand: 5 bytes
             Jump(_) | JumpIfFalse(_) | JumpIfTrue(_) | Loop(_) => 5,
 
+            // Instructions with u32 and i32 operands: 9 bytes
+            CountDown(_, _) => 9,
+
             // Instructions with String operand: variable (4 bytes length + string bytes)
             LoadGlobal(s) | StoreGlobal(s) => 5 + s.len(),
 
@@ -284,6 +292,7 @@ impl Instruction {
             JumpIfFalse(_) => "JumpIfFalse",
             JumpIfTrue(_) => "JumpIfTrue",
             Loop(_) => "Loop",
+            CountDown(_, _) => "CountDown",
             Call(_) => "Call",
             Return => "Return",
             BuildList(_) => "BuildList",
@@ -323,6 +332,7 @@ impl fmt::Display for Instruction {
             JumpIfFalse(offset) => write!(f, "JumpIfFalse {}", offset),
             JumpIfTrue(offset) => write!(f, "JumpIfTrue {}", offset),
             Loop(offset) => write!(f, "Loop {}", offset),
+            CountDown(idx, offset) => write!(f, "CountDown {} {}", idx, offset),
             Call(argc) => write!(f, "Call {}", argc),
             BuildList(count) => write!(f, "BuildList {}", count),
             BuildDict(count) => write!(f, "BuildDict {}", count),
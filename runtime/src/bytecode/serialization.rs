@@ -10,7 +10,8 @@ use std::path::Path;
 const MAGIC: &[u8; 4] = b"POHC";
 
 /// Current bytecode format version
-const VERSION: u32 = 1;
+/// Version 2 added the CountDown instruction (opcode 34)
+const VERSION: u32 = 2;
 
 /// Serialization errors
 #[derive(Debug)]
@@ -183,6 +184,11 @@ impl BytecodeSerializer {
                 buf.push(33);
                 buf.write_all(&offset.to_le_bytes())?;
             }
+            Instruction::CountDown(idx, offset) => {
+                buf.push(34);
+                buf.write_all(&idx.to_le_bytes())?;
+                buf.write_all(&offset.to_le_bytes())?;
+            }
             Instruction::Call(argc) => {
                 buf.push(40);
                 buf.push(*argc);
@@ -249,7 +255,8 @@ impl BytecodeDeserializer {
 
         // Read version
         let version = Self::read_u32(bytes, &mut cursor)?;
-        if version != VERSION {
+        // Older formats only use a subset of the current opcodes, so they stay readable
+        if version == 0 || version > VERSION {
             return Err(SerializationError::UnsupportedVersion(version));
         }
 
@@ -448,6 +455,10 @@ impl BytecodeDeserializer {
             31 => Instruction::JumpIfFalse(Self::read_i32(bytes, cursor)?),
             32 => Instruction::JumpIfTrue(Self::read_i32(bytes, cursor)?),
             33 => Instruction::Loop(Self::read_i32(bytes, cursor)?),
+            34 => {
+                let idx = Self::read_u32(bytes, cursor)?;
+                Instruction::CountDown(idx, Self::read_i32(bytes, cursor)?)
+            }
             40 => {
                 if *cursor >= bytes.len() {
                     return Err(SerializationError::InvalidData(
@@ -6,6 +6,7 @@ use std::collections::hash_map::DefaultHasher;
 use std::collections::HashMap;
 use std::fmt;
 use std::hash::{Hash, Hasher};
+use std::rc::Rc;
 use std::time::{Duration, Instant};
 
 /// Runtime value representation
@@ -212,8 +213,9 @@ pub struct BytecodeVM {
     /// Instruction pointer
     ip: usize,
 
-    /// Current chunk being executed
-    chunk: Option<BytecodeChunk>,
+    /// Current chunk being executed (shared so the run loop can borrow
+    /// instructions without cloning them)
+    chunk: Option<Rc<BytecodeChunk>>,
 
     /// Output buffer (for testing)
     pub output: Vec<String>,
@@ -263,7 +265,7 @@ impl BytecodeVM {
 
     /// Load a bytecode chunk and prepare for execution
     pub fn load(&mut self, chunk: BytecodeChunk) {
-        self.chunk = Some(chunk);
+        self.chunk = Some(Rc::new(chunk));
         self.ip = 0;
         self.stack.clear();
         for slot in self.locals.iter_mut() {
@@ -296,16 +298,16 @@ impl BytecodeVM {
 
     /// Internal run loop
     fn run_loop(&mut self) -> VMResult<Value> {
+        let chunk = Rc::clone(self.chunk.as_ref().unwrap());
         loop {
             // Check if we've reached the end
-            let chunk = self.chunk.as_ref().unwrap();
             if self.ip >= chunk.code.len() {
                 // Return top of stack or null
                 return Ok(self.pop().unwrap_or(Value::Null));
             }
 
             // Fetch and execute instruction
-            let instruction = &chunk.code[self.ip].clone();
+            let instruction = &chunk.code[self.ip];
             self.ip += 1;
 
             // Record instruction in stats
@@ -526,6 +528,18 @@ impl BytecodeVM {
                 self.ip = (self.ip as i32 - offset) as usize;
             }
 
+            Instruction::CountDown(idx, offset) => {
+                let counter = self
+                    .locals
+                    .get_mut(*idx as usize)
+                    .ok_or(VMError::InvalidLocalIndex(*idx))?;
+                match counter {
+                    Value::Number(n) if *n > 0.0 => *n -= 1.0,
+                    Value::Number(_) => self.ip = (self.ip as i32 + offset) as usize,
+                    _ => return Err(VMError::TypeError("Repeat requires a number".to_string())),
+                }
+            }
+
             Instruction::Call(argc) => {
                 // For now, we'll just pop the arguments and function
                 // Full implementation would require function objects
@@ -832,7 +846,7 @@ mod tests {
 
     #[test]
     fn test_vm_error_with_line_numbers() {
-        use super::DebugInfo;
+        use crate::bytecode::DebugInfo;
 
         let mut chunk = BytecodeChunk::new(1);
         chunk.constants.push(Constant::Number(10.0));
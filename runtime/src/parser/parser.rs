@@ -3,9 +3,24 @@ use crate::parser::phrases as P;
 use crate::parser::phrases::strip_prefix_ci;
 use anyhow::{anyhow, Result};
 
+// Block terminators, shared by the block parsers so the stop lists are not rebuilt per block
+const IF_STOPS: &[&str] = &["Otherwise", "End If", "End"];
+const IF_END_STOPS: &[&str] = &["End If", "End"];
+const END_STOPS: &[&str] = &["End"];
+const TRY_STOPS: &[&str] = &[P::P_IF_ERROR, P::P_FINALLY, P::P_END_TRY, "End"];
+const FINALLY_STOPS: &[&str] = &[P::P_END_TRY, "End"];
+
 // Helper to check if a line starts with any of the given prefixes (case-insensitive)
 fn line_starts_with_any(line: &str, prefixes: &[&str]) -> bool {
+    // Compare the lowered head byte first so most lines are rejected without a full prefix compare
+    let head = match line.as_bytes().first() {
+        Some(b) => b.to_ascii_lowercase(),
+        None => return false,
+    };
     for prefix in prefixes {
+        if prefix.as_bytes().first().map(|b| b.to_ascii_lowercase()) != Some(head) {
+            continue;
+        }
         if P::strip_prefix_ci(line, prefix).is_some() {
             return true;
         }
@@ -13,51 +28,53 @@ fn line_starts_with_any(line: &str, prefixes: &[&str]) -> bool {
     false
 }
 
+// Hints appended to parse errors, keyed by a fragment of the message. A static table, since
+// errors raised while probing alternatives (e.g. phrasal calls) are often discarded.
+const FIX_HINTS: &[(&str, &str)] = &[
+    (
+        "Expected 'with'",
+        "Hint: Function definitions use 'Define function name with parameter as expression'",
+    ),
+    (
+        "Expected function name",
+        "Hint: Function name must be a valid identifier (letters, numbers, underscore)",
+    ),
+    (
+        "Expected 'as <expr>'",
+        "Hint: Inline functions need 'as' followed by an expression",
+    ),
+    (
+        "Expected variable name",
+        "Hint: Variable names must start with a letter or underscore",
+    ),
+    (
+        "Could not parse expression",
+        "Hint: Check for unmatched brackets [], braces {}, or parentheses ()",
+    ),
+    (
+        "Empty expression",
+        "Hint: Expressions cannot be empty. Provide a value, variable, or operation",
+    ),
+    (
+        "Unsupported statement",
+        "Hint: Valid statements: Write, Set, Ask for, If, Repeat, While, Make, Use, Import",
+    ),
+    (
+        "out of range",
+        "Hint: Check array bounds. Use negative indexing (-1) for last element",
+    ),
+    (
+        "not found",
+        "Hint: Verify the key exists in the dictionary or check for typos",
+    ),
+    (
+        "division by zero",
+        "Hint: Ensure denominator is not zero before dividing",
+    ),
+];
+
 fn suggest_fix(error_msg: &str, context: &str) -> String {
-    let suggestions = vec![
-        (
-            "Expected 'with'",
-            "Hint: Function definitions use 'Define function name with parameter as expression'",
-        ),
-        (
-            "Expected function name",
-            "Hint: Function name must be a valid identifier (letters, numbers, underscore)",
-        ),
-        (
-            "Expected 'as <expr>'",
-            "Hint: Inline functions need 'as' followed by an expression",
-        ),
-        (
-            "Expected variable name",
-            "Hint: Variable names must start with a letter or underscore",
-        ),
-        (
-            "Could not parse expression",
-            "Hint: Check for unmatched brackets [], braces {}, or parentheses ()",
-        ),
-        (
-            "Empty expression",
-            "Hint: Expressions cannot be empty. Provide a value, variable, or operation",
-        ),
-        (
-            "Unsupported statement",
-            "Hint: Valid statements: Write, Set, Ask for, If, Repeat, While, Make, Use, Import",
-        ),
-        (
-            "out of range",
-            "Hint: Check array bounds. Use negative indexing (-1) for last element",
-        ),
-        (
-            "not found",
-            "Hint: Verify the key exists in the dictionary or check for typos",
-        ),
-        (
-            "division by zero",
-            "Hint: Ensure denominator is not zero before dividing",
-        ),
-    ];
-
-    for (pattern, suggestion) in suggestions {
+    for (pattern, suggestion) in FIX_HINTS {
         if error_msg.contains(pattern) {
             return format!("{}.\n{}", error_msg, suggestion);
         }
@@ -82,6 +99,11 @@ fn suggest_fix(error_msg: &str, context: &str) -> String {
     error_msg.to_string()
 }
 
+// Whole-line comment check (`//` or `#`) on an already trimmed line, decided from the head bytes
+fn is_comment(t: &str) -> bool {
+    matches!(t.as_bytes(), [b'#', ..] | [b'/', b'/', ..])
+}
+
 // AST types now provided by crate::parser::ast
 
 pub fn parse(src: &str) -> Result<Program> {
@@ -91,7 +113,7 @@ pub fn parse(src: &str) -> Result<Program> {
     // Skip leading blank lines and comments
     while i < lines.len() {
         let trimmed = lines[i].trim();
-        if trimmed.is_empty() || trimmed.starts_with("//") || trimmed.starts_with("#") {
+        if trimmed.is_empty() || is_comment(trimmed) {
             i += 1;
         } else {
             break;
@@ -142,21 +164,16 @@ fn parse_until_keywords(lines: &[&str], i: &mut usize, stops: &[&str]) -> Result
     let mut out = Vec::new();
     while *i < lines.len() {
         let t = lines[*i].trim();
-        // Check exact match or prefix match
-        if stops.contains(&t) || line_starts_with_any(t, stops) {
-            break;
-        }
-
-        // Skip blank lines
-        if t.is_empty() {
+        // Skip blank lines and comments (lines starting with // or #) before probing for a
+        // block terminator; no stop keyword can match either of them
+        if t.is_empty() || is_comment(t) {
             *i += 1;
             continue;
         }
 
-        // Skip comments (lines starting with // or #)
-        if t.starts_with("//") || t.starts_with("#") {
-            *i += 1;
-            continue;
+        // Prefix match (case-insensitive) also covers exact matches
+        if line_starts_with_any(t, stops) {
+            break;
         }
 
         // Define function (inline)
@@ -281,10 +298,8 @@ fn parse_until_keywords(lines: &[&str], i: &mut usize, stops: &[&str]) -> Result
         }
         // Inline If
         if let Some(rest) = t.strip_prefix("If ") {
-            if t.contains(" Write ") {
-                let lc = rest;
-                let (cond_str, after_cond) = split_once_word(lc, " Write ")
-                    .ok_or_else(|| anyhow!("Expected 'Write' after condition"))?;
+            // A single search for " Write " both selects the inline form and splits it
+            if let Some((cond_str, after_cond)) = split_once_word(rest, " Write ") {
                 let (then_str, otherwise_part) =
                     split_once_word(after_cond, " Otherwise ").unwrap_or((after_cond, ""));
                 let then_expr = parse_expr(then_str.trim())?;
@@ -315,15 +330,15 @@ fn parse_until_keywords(lines: &[&str], i: &mut usize, stops: &[&str]) -> Result
             let rest = rest.trim().strip_suffix(':').unwrap_or(rest.trim());
             let cond_expr = parse_expr(rest)?;
             *i += 1;
-            let then_body = parse_until_keywords(lines, i, &["Otherwise", "End If", "End"])?;
+            let then_body = parse_until_keywords(lines, i, IF_STOPS)?;
             let mut otherwise_body = None;
             if *i < lines.len() && lines[*i].trim() == "Otherwise" {
                 *i += 1;
-                otherwise_body = Some(parse_until_keywords(lines, i, &["End If", "End"])?);
+                otherwise_body = Some(parse_until_keywords(lines, i, IF_END_STOPS)?);
             }
             if *i < lines.len() {
                 let end_line = lines[*i].trim();
-                if end_line == "End If" || end_line == "End" {
+                if IF_END_STOPS.contains(&end_line) {
                     *i += 1;
                 } else {
                     return Err(anyhow!("Expected 'End If' or 'End', found '{}'", end_line));
@@ -390,7 +405,7 @@ fn parse_until_keywords(lines: &[&str], i: &mut usize, stops: &[&str]) -> Result
         if let Some(rest) = t.strip_prefix("While ") {
             let cond_expr = parse_expr(rest.trim())?;
             *i += 1;
-            let body = parse_until_keywords(lines, i, &["End"])?;
+            let body = parse_until_keywords(lines, i, END_STOPS)?;
             if *i < lines.len() && lines[*i].trim() == "End" {
                 *i += 1;
             } else {
@@ -412,7 +427,7 @@ fn parse_until_keywords(lines: &[&str], i: &mut usize, stops: &[&str]) -> Result
             }
             let count_expr = parse_expr(r.trim())?;
             *i += 1;
-            let body = parse_until_keywords(lines, i, &["End"])?;
+            let body = parse_until_keywords(lines, i, END_STOPS)?;
             if *i < lines.len() && lines[*i].trim() == "End" {
                 *i += 1;
             } else {
@@ -442,7 +457,7 @@ fn parse_until_keywords(lines: &[&str], i: &mut usize, stops: &[&str]) -> Result
                 // Block func
                 let params = parse_params(after_with)?;
                 *i += 1;
-                let body = parse_until_keywords(lines, i, &["End"])?;
+                let body = parse_until_keywords(lines, i, END_STOPS)?;
                 if *i < lines.len() && lines[*i].trim() == "End" {
                     *i += 1;
                 } else {
@@ -470,11 +485,7 @@ fn parse_until_keywords(lines: &[&str], i: &mut usize, stops: &[&str]) -> Result
         if P::strip_prefix_ci(t, P::P_TRY).is_some() {
             *i += 1;
             // Parse try block
-            let try_block = parse_until_keywords(
-                lines,
-                i,
-                &[P::P_IF_ERROR, P::P_FINALLY, P::P_END_TRY, "End"],
-            )?;
+            let try_block = parse_until_keywords(lines, i, TRY_STOPS)?;
 
             let mut catch_handlers = Vec::new();
             let mut finally_block = None;
@@ -509,11 +520,7 @@ fn parse_until_keywords(lines: &[&str], i: &mut usize, stops: &[&str]) -> Result
                     // else: just "if error" - catch all without binding
 
                     // Parse catch body
-                    let block = parse_until_keywords(
-                        lines,
-                        i,
-                        &[P::P_IF_ERROR, P::P_FINALLY, P::P_END_TRY, "End"],
-                    )?;
+                    let block = parse_until_keywords(lines, i, TRY_STOPS)?;
 
                     catch_handlers.push(CatchHandler {
                         error_type,
@@ -526,7 +533,7 @@ fn parse_until_keywords(lines: &[&str], i: &mut usize, stops: &[&str]) -> Result
                 // Check for "finally"
                 if P::strip_prefix_ci(line, P::P_FINALLY).is_some() {
                     *i += 1;
-                    finally_block = Some(parse_until_keywords(lines, i, &[P::P_END_TRY, "End"])?);
+                    finally_block = Some(parse_until_keywords(lines, i, FINALLY_STOPS)?);
                     continue;
                 }
 
@@ -674,85 +681,79 @@ fn split_once_word<'a>(s: &'a str, pat: &str) -> Option<(&'a str, &'a str)> {
 }
 
 fn split_ident(s: &str) -> Option<(String, &str)> {
-    let mut chars = s.chars();
+    split_ident_str(s).map(|(id, rest)| (id.to_string(), rest))
+}
+
+// Borrowing variant of split_ident for probes that may not need an owned name
+fn split_ident_str(s: &str) -> Option<(&str, &str)> {
+    // Classify ASCII bytes directly; only non-ASCII characters are decoded
+    let bytes = s.as_bytes();
     let mut i = 0;
-    for c in chars.by_ref() {
-        if c.is_alphanumeric() || c == '_' {
-            i += c.len_utf8();
-        } else {
+    while i < bytes.len() {
+        let b = bytes[i];
+        if b.is_ascii_alphanumeric() || b == b'_' {
+            i += 1;
+        } else if b.is_ascii() {
             break;
+        } else {
+            let c = s[i..].chars().next().unwrap();
+            if !c.is_alphanumeric() {
+                break;
+            }
+            i += c.len_utf8();
         }
     }
     if i == 0 {
         return None;
     }
-    Some((s[..i].to_string(), &s[i..]))
+    Some((&s[..i], &s[i..]))
 }
 
 fn parse_params(s: &str) -> Result<Vec<Param>> {
     let mut out = Vec::new();
     let mut depth = 0i32;
     let mut in_str = false;
-    let mut buf = String::new();
-    for ch in s.chars() {
+    let mut start = 0;
+    for (i, ch) in s.char_indices() {
         match ch {
-            '"' => {
-                in_str = !in_str;
-                buf.push(ch);
-            }
-            '(' if !in_str => {
-                depth += 1;
-                buf.push(ch);
-            }
-            ')' if !in_str => {
-                depth -= 1;
-                buf.push(ch);
-            }
+            '"' => in_str = !in_str,
+            '(' if !in_str => depth += 1,
+            ')' if !in_str => depth -= 1,
             ',' if !in_str && depth == 0 => {
-                let item = buf.trim().to_string();
+                let item = s[start..i].trim();
                 if !item.is_empty() {
-                    out.push(parse_param_item(&item)?);
+                    out.push(parse_param_item(item)?);
                 }
-                buf.clear();
+                start = i + 1;
             }
-            _ => buf.push(ch),
+            _ => {}
         }
     }
-    if !buf.trim().is_empty() {
-        out.push(parse_param_item(buf.trim())?);
+    let last = s[start..].trim();
+    if !last.is_empty() {
+        out.push(parse_param_item(last)?);
     }
     Ok(out)
 }
 
+// Separators introducing a parameter default value
+const PARAM_DEFAULT_SEPS: &[&str] = &[" set to ", " defaulting to "];
+
 fn parse_param_item(s: &str) -> Result<Param> {
     let s = s.trim();
-    if let Some(idx) = s.find(" set to ") {
-        let name = s[..idx].trim();
-        let expr_str = &s[idx + " set to ".len()..];
-        if let Some((n, rest)) = split_ident(name) {
-            if rest.trim().is_empty() {
-                let def = parse_expr(expr_str.trim())?;
-                return Ok(Param {
-                    name: n,
-                    default: Some(def),
-                });
-            }
-        }
-        return Err(anyhow!("Invalid parameter default: {}", s));
-    }
-    if let Some(idx) = s.find(" defaulting to ") {
-        let name = s[..idx].trim();
-        let expr_str = &s[idx + " defaulting to ".len()..];
-        if let Some((n, rest)) = split_ident(name) {
-            if rest.trim().is_empty() {
-                let def = parse_expr(expr_str.trim())?;
-                return Ok(Param {
-                    name: n,
-                    default: Some(def),
-                });
+    for sep in PARAM_DEFAULT_SEPS {
+        if let Some((name, expr_str)) = s.split_once(sep) {
+            if let Some((n, rest)) = split_ident(name.trim()) {
+                if rest.trim().is_empty() {
+                    let def = parse_expr(expr_str.trim())?;
+                    return Ok(Param {
+                        name: n,
+                        default: Some(def),
+                    });
+                }
             }
+            return Err(anyhow!("Invalid parameter default: {}", s));
         }
-        return Err(anyhow!("Invalid parameter default: {}", s));
     }
     if let Some((n, rest)) = split_ident(s) {
         if rest.trim().is_empty() {
@@ -771,11 +772,11 @@ fn parse_arg_list(s: &str) -> Result<Vec<Expr>> {
 
 fn parse_arg_list_multi(s: &str, allow_and: bool) -> Result<Vec<Expr>> {
     // Split by commas (always) and optionally by " and " at top level
-    let mut parts: Vec<String> = split_top_level(s, ",");
+    let mut parts = split_top_level(s, ",");
     if allow_and {
-        let mut expanded = Vec::new();
+        let mut expanded = Vec::with_capacity(parts.len());
         for p in parts.into_iter() {
-            let sub = split_top_level(&p, " and ");
+            let sub = split_top_level(p, " and ");
             for item in sub {
                 if !item.trim().is_empty() {
                     expanded.push(item);
@@ -784,7 +785,7 @@ fn parse_arg_list_multi(s: &str, allow_and: bool) -> Result<Vec<Expr>> {
         }
         parts = expanded;
     }
-    let mut args = Vec::new();
+    let mut args = Vec::with_capacity(parts.len());
     for p in parts {
         let t = p.trim();
         if t.is_empty() {
@@ -801,7 +802,7 @@ pub fn parse_expr(s: &str) -> Result<Expr> {
 
 fn try_parse_phrasal_call(s: &str) -> Option<Expr> {
     let st = s.trim();
-    if let Some((name, after)) = split_ident(st) {
+    if let Some((name, after)) = split_ident_str(st) {
         let after = after.trim_start();
         if let Some(rest) = strip_prefix_ci(after, "with ") {
             // Don't treat "error of type X with message Y" as a phrasal call
@@ -810,7 +811,10 @@ fn try_parse_phrasal_call(s: &str) -> Option<Expr> {
                 return None;
             }
             if let Ok(args) = parse_arg_list_multi(rest, true) {
-                return Some(Expr::Call { name, args });
+                return Some(Expr::Call {
+                    name: name.to_string(),
+                    args,
+                });
             }
         }
     }
@@ -818,6 +822,11 @@ fn try_parse_phrasal_call(s: &str) -> Option<Expr> {
 }
 
 fn parse_or(s: &str) -> Result<Expr> {
+    // Every operator handled between here and parse_postfix (or, and, not, comparisons,
+    // arithmetic, phrasal calls) contains a space, so a space-free term skips their scans
+    if !s.contains(' ') {
+        return parse_postfix(s);
+    }
     if let Some(call) = try_parse_phrasal_call(s) {
         return Ok(call);
     }
@@ -831,13 +840,18 @@ fn parse_or(s: &str) -> Result<Expr> {
         }
         return Ok(e);
     }
-    parse_and(s)
+    // `s` has already been probed for a phrasal call above
+    parse_and_chain(s)
 }
 
 fn parse_and(s: &str) -> Result<Expr> {
     if let Some(call) = try_parse_phrasal_call(s) {
         return Ok(call);
     }
+    parse_and_chain(s)
+}
+
+fn parse_and_chain(s: &str) -> Result<Expr> {
     let parts = split_top_level_multi(s, &[" And ", " and "]);
     if parts.len() > 1 {
         let mut it = parts.into_iter();
@@ -862,164 +876,166 @@ fn parse_not(s: &str) -> Result<Expr> {
     parse_cmp(st)
 }
 
+// Comparison operators in priority order: longer phrasal patterns first so they win over
+// their shorter prefixes, and phrasal forms before symbolic ones
+const CMP_OPS: &[(&str, CmpOp)] = &[
+    // Full phrasal forms with "is" (longest patterns first)
+    (" is greater than or equal to ", CmpOp::Ge),
+    (" is less than or equal to ", CmpOp::Le),
+    (" Is Greater Than Or Equal To ", CmpOp::Ge),
+    (" Is Less Than Or Equal To ", CmpOp::Le),
+    (" is not equal to ", CmpOp::Ne),
+    (" Is Not Equal To ", CmpOp::Ne),
+    (" is equal to ", CmpOp::Eq),
+    (" Is Equal To ", CmpOp::Eq),
+    (" is greater than ", CmpOp::Gt),
+    (" is less than ", CmpOp::Lt),
+    (" Is Greater Than ", CmpOp::Gt),
+    (" Is Less Than ", CmpOp::Lt),
+    // Shorter forms without "is"
+    (" Greater Or Equal ", CmpOp::Ge),
+    (" Less Or Equal ", CmpOp::Le),
+    (" greater or equal ", CmpOp::Ge),
+    (" less or equal ", CmpOp::Le),
+    (" Greater Than ", CmpOp::Gt),
+    (" Less Than ", CmpOp::Lt),
+    (" greater than ", CmpOp::Gt),
+    (" less than ", CmpOp::Lt),
+    (" Not Equals ", CmpOp::Ne),
+    (" not equals ", CmpOp::Ne),
+    (" Equals ", CmpOp::Eq),
+    (" equals ", CmpOp::Eq),
+    // Basic "is" (check before symbolic to prefer phrasal)
+    (" is not ", CmpOp::Ne),
+    (" Is Not ", CmpOp::Ne),
+    (" is ", CmpOp::Eq),
+    (" Is ", CmpOp::Eq),
+    // Symbolic operators (check after phrasal forms)
+    (" >= ", CmpOp::Ge),
+    (" <= ", CmpOp::Le),
+    (" != ", CmpOp::Ne),
+    (" == ", CmpOp::Eq),
+    (" > ", CmpOp::Gt),
+    (" < ", CmpOp::Lt),
+    (" = ", CmpOp::Eq),
+];
+
 fn parse_cmp(s: &str) -> Result<Expr> {
-    // Recognize comparisons at top-level, not inside strings or parens; prefer longest match
-    // Order matters: check longer patterns first to avoid premature matching
-    let cmps = [
-        // Full phrasal forms with "is" (longest patterns first)
-        (" is greater than or equal to ", CmpOp::Ge),
-        (" is less than or equal to ", CmpOp::Le),
-        (" Is Greater Than Or Equal To ", CmpOp::Ge),
-        (" Is Less Than Or Equal To ", CmpOp::Le),
-        (" is not equal to ", CmpOp::Ne),
-        (" Is Not Equal To ", CmpOp::Ne),
-        (" is equal to ", CmpOp::Eq),
-        (" Is Equal To ", CmpOp::Eq),
-        (" is greater than ", CmpOp::Gt),
-        (" is less than ", CmpOp::Lt),
-        (" Is Greater Than ", CmpOp::Gt),
-        (" Is Less Than ", CmpOp::Lt),
-        // Shorter forms without "is"
-        (" Greater Or Equal ", CmpOp::Ge),
-        (" Less Or Equal ", CmpOp::Le),
-        (" greater or equal ", CmpOp::Ge),
-        (" less or equal ", CmpOp::Le),
-        (" Greater Than ", CmpOp::Gt),
-        (" Less Than ", CmpOp::Lt),
-        (" greater than ", CmpOp::Gt),
-        (" less than ", CmpOp::Lt),
-        (" Not Equals ", CmpOp::Ne),
-        (" not equals ", CmpOp::Ne),
-        (" Equals ", CmpOp::Eq),
-        (" equals ", CmpOp::Eq),
-        // Basic "is" (check before symbolic to prefer phrasal)
-        (" is not ", CmpOp::Ne),
-        (" Is Not ", CmpOp::Ne),
-        (" is ", CmpOp::Eq),
-        (" Is ", CmpOp::Eq),
-        // Symbolic operators (check after phrasal forms)
-        (" >= ", CmpOp::Ge),
-        (" <= ", CmpOp::Le),
-        (" != ", CmpOp::Ne),
-        (" == ", CmpOp::Eq),
-        (" > ", CmpOp::Gt),
-        (" < ", CmpOp::Lt),
-        (" = ", CmpOp::Eq),
-    ];
-    for (pat, op) in cmps.iter() {
-        if let Some((l, r)) = split_once_top_level(s, pat) {
-            let le = parse_add(l.trim())?;
-            let re = parse_add(r.trim())?;
-            return Ok(Expr::Cmp(op.clone(), Box::new(le), Box::new(re)));
+    // Recognize comparisons at top-level, not inside strings or parens. A single scan records
+    // the leftmost top-level position of each pattern; the highest-priority pattern found wins.
+    let bytes = s.as_bytes();
+    let mut in_str = false;
+    let mut depth = 0i32;
+    let mut best: Option<(usize, usize)> = None; // (index into CMP_OPS, byte position)
+    for i in 0..bytes.len() {
+        match bytes[i] {
+            b'"' => in_str = !in_str,
+            b'(' | b'[' | b'{' if !in_str => depth += 1,
+            b')' | b']' | b'}' if !in_str => depth -= 1,
+            b' ' if !in_str && depth == 0 => {
+                let limit = best.map_or(CMP_OPS.len(), |(k, _)| k);
+                for (k, (pat, _)) in CMP_OPS[..limit].iter().enumerate() {
+                    if bytes[i..].starts_with(pat.as_bytes()) {
+                        best = Some((k, i));
+                        break;
+                    }
+                }
+                if matches!(best, Some((0, _))) {
+                    break;
+                }
+            }
+            _ => {}
         }
     }
+    if let Some((k, i)) = best {
+        let (pat, op) = &CMP_OPS[k];
+        let le = parse_add(s[..i].trim())?;
+        let re = parse_add(s[i + pat.len()..].trim())?;
+        return Ok(Expr::Cmp(op.clone(), Box::new(le), Box::new(re)));
+    }
     parse_add(s)
 }
 
-fn parse_add(s: &str) -> Result<Expr> {
-    // Handle addition and subtraction (left-to-right)
-    // Support both phrasal (plus/minus) and symbolic (+/-)
-    let plus_parts = split_top_level(s, " plus ");
-    let minus_parts = split_top_level(s, " minus ");
-    let sym_plus_parts = split_top_level(s, " + ");
-    let sym_minus_parts = split_top_level(s, " - ");
-
-    // If we have any operators, process them in order
-    if plus_parts.len() > 1
-        || minus_parts.len() > 1
-        || sym_plus_parts.len() > 1
-        || sym_minus_parts.len() > 1
-    {
-        // Find which operator comes first
-        let mut tokens: Vec<(usize, bool, String)> = Vec::new(); // (position, is_plus, text)
-        let mut pos = 0;
-        let bytes = s.as_bytes();
-        let mut in_str = false;
-        let mut depth = 0;
-        let mut buf = String::new();
-
-        let mut i = 0;
-        while i < bytes.len() {
-            if bytes[i] == b'"' {
-                in_str = !in_str;
-                buf.push('"');
+// Additive operators; phrasal forms are checked before symbolic ones. The flag marks plus.
+const ADD_OPS: &[(&str, bool)] = &[
+    (" plus ", true),
+    (" minus ", false),
+    (" + ", true),
+    (" - ", false),
+];
+// Multiplicative operators; phrasal forms are checked before symbolic ones. The flag marks times.
+const MULT_OPS: &[(&str, bool)] = &[
+    (" divided by ", false),
+    (" times ", true),
+    (" * ", true),
+    (" / ", false),
+];
+
+// Split `s` at top-level binary operators (not inside strings or brackets). Each operand is
+// returned as a trimmed slice of `s`, tagged with the flag of the operator that follows it.
+fn split_operands<'a>(s: &'a str, ops: &[(&str, bool)]) -> Vec<(bool, &'a str)> {
+    let mut operands = Vec::new();
+    let bytes = s.as_bytes();
+    let mut in_str = false;
+    let mut depth = 0i32;
+    let mut start = 0;
+    let mut i = 0;
+    'scan: while i < bytes.len() {
+        if bytes[i] == b'"' {
+            in_str = !in_str;
+            i += 1;
+            continue;
+        }
+        if !in_str {
+            if bytes[i] == b'(' || bytes[i] == b'[' || bytes[i] == b'{' {
+                depth += 1;
                 i += 1;
                 continue;
             }
-            if !in_str {
-                if bytes[i] == b'(' || bytes[i] == b'[' || bytes[i] == b'{' {
-                    depth += 1;
-                    buf.push(bytes[i] as char);
-                    i += 1;
-                    continue;
-                }
-                if bytes[i] == b')' || bytes[i] == b']' || bytes[i] == b'}' {
-                    depth -= 1;
-                    buf.push(bytes[i] as char);
-                    i += 1;
-                    continue;
-                }
-                if depth == 0 {
-                    // Check phrasal operators first (longer patterns)
-                    if s[i..].starts_with(" plus ") {
-                        if !buf.trim().is_empty() {
-                            tokens.push((pos, true, buf.trim().to_string()));
-                        }
-                        buf.clear();
-                        i += " plus ".len();
-                        pos = tokens.len();
-                        continue;
-                    }
-                    if s[i..].starts_with(" minus ") {
-                        if !buf.trim().is_empty() {
-                            tokens.push((pos, false, buf.trim().to_string()));
-                        }
-                        buf.clear();
-                        i += " minus ".len();
-                        pos = tokens.len();
-                        continue;
-                    }
-                    // Check symbolic operators
-                    if s[i..].starts_with(" + ") {
-                        if !buf.trim().is_empty() {
-                            tokens.push((pos, true, buf.trim().to_string()));
-                        }
-                        buf.clear();
-                        i += " + ".len();
-                        pos = tokens.len();
-                        continue;
-                    }
-                    if s[i..].starts_with(" - ") {
-                        if !buf.trim().is_empty() {
-                            tokens.push((pos, false, buf.trim().to_string()));
+            if bytes[i] == b')' || bytes[i] == b']' || bytes[i] == b'}' {
+                depth -= 1;
+                i += 1;
+                continue;
+            }
+            if depth == 0 {
+                for &(op, flag) in ops {
+                    if s[i..].starts_with(op) {
+                        let operand = s[start..i].trim();
+                        if !operand.is_empty() {
+                            operands.push((flag, operand));
                         }
-                        buf.clear();
-                        i += " - ".len();
-                        pos = tokens.len();
-                        continue;
+                        i += op.len();
+                        start = i;
+                        continue 'scan;
                     }
                 }
             }
-            buf.push(s[i..].chars().next().unwrap());
-            i += s[i..].chars().next().unwrap().len_utf8();
-        }
-        if !buf.trim().is_empty() {
-            tokens.push((pos, true, buf.trim().to_string())); // Last token, operator doesn't matter
         }
+        i += s[i..].chars().next().unwrap().len_utf8();
+    }
+    let last = s[start..].trim();
+    if !last.is_empty() {
+        operands.push((true, last)); // Last operand, operator doesn't matter
+    }
+    operands
+}
 
-        if tokens.len() > 1 {
-            let mut expr = parse_mult(tokens[0].2.trim())?;
-            for i in 1..tokens.len() {
-                let rhs = parse_mult(tokens[i].2.trim())?;
-                if tokens[i - 1].1 {
-                    // Previous token marked as plus
-                    expr = Expr::Plus(Box::new(expr), Box::new(rhs));
-                } else {
-                    expr = Expr::Minus(Box::new(expr), Box::new(rhs));
-                }
+fn parse_add(s: &str) -> Result<Expr> {
+    // Handle addition and subtraction (left-to-right)
+    // Support both phrasal (plus/minus) and symbolic (+/-)
+    let operands = split_operands(s, ADD_OPS);
+    if operands.len() > 1 {
+        let mut expr = parse_mult(operands[0].1)?;
+        for pair in operands.windows(2) {
+            let rhs = parse_mult(pair[1].1)?;
+            if pair[0].0 {
+                // Previous operand was followed by plus
+                expr = Expr::Plus(Box::new(expr), Box::new(rhs));
+            } else {
+                expr = Expr::Minus(Box::new(expr), Box::new(rhs));
             }
-            return Ok(expr);
         }
+        return Ok(expr);
     }
 
     parse_mult(s)
@@ -1028,106 +1044,19 @@ fn parse_add(s: &str) -> Result<Expr> {
 fn parse_mult(s: &str) -> Result<Expr> {
     // Handle multiplication and division (left-to-right, higher precedence than +/-)
     // Support both phrasal (times/divided by) and symbolic (*/)
-    let times_parts = split_top_level(s, " times ");
-    let div_parts = split_top_level(s, " divided by ");
-    let sym_mult_parts = split_top_level(s, " * ");
-    let sym_div_parts = split_top_level(s, " / ");
-
-    if times_parts.len() > 1
-        || div_parts.len() > 1
-        || sym_mult_parts.len() > 1
-        || sym_div_parts.len() > 1
-    {
-        // Find which operator comes first
-        let mut tokens: Vec<(usize, bool, String)> = Vec::new(); // (position, is_times, text)
-        let mut pos = 0;
-        let bytes = s.as_bytes();
-        let mut in_str = false;
-        let mut depth = 0;
-        let mut buf = String::new();
-
-        let mut i = 0;
-        while i < bytes.len() {
-            if bytes[i] == b'"' {
-                in_str = !in_str;
-                buf.push('"');
-                i += 1;
-                continue;
-            }
-            if !in_str {
-                if bytes[i] == b'(' || bytes[i] == b'[' || bytes[i] == b'{' {
-                    depth += 1;
-                    buf.push(bytes[i] as char);
-                    i += 1;
-                    continue;
-                }
-                if bytes[i] == b')' || bytes[i] == b']' || bytes[i] == b'}' {
-                    depth -= 1;
-                    buf.push(bytes[i] as char);
-                    i += 1;
-                    continue;
-                }
-                if depth == 0 {
-                    // Check phrasal operators first (longer patterns)
-                    if s[i..].starts_with(" divided by ") {
-                        if !buf.trim().is_empty() {
-                            tokens.push((pos, false, buf.trim().to_string()));
-                        }
-                        buf.clear();
-                        i += " divided by ".len();
-                        pos = tokens.len();
-                        continue;
-                    }
-                    if s[i..].starts_with(" times ") {
-                        if !buf.trim().is_empty() {
-                            tokens.push((pos, true, buf.trim().to_string()));
-                        }
-                        buf.clear();
-                        i += " times ".len();
-                        pos = tokens.len();
-                        continue;
-                    }
-                    // Check symbolic operators
-                    if s[i..].starts_with(" * ") {
-                        if !buf.trim().is_empty() {
-                            tokens.push((pos, true, buf.trim().to_string()));
-                        }
-                        buf.clear();
-                        i += " * ".len();
-                        pos = tokens.len();
-                        continue;
-                    }
-                    if s[i..].starts_with(" / ") {
-                        if !buf.trim().is_empty() {
-                            tokens.push((pos, false, buf.trim().to_string()));
-                        }
-                        buf.clear();
-                        i += " / ".len();
-                        pos = tokens.len();
-                        continue;
-                    }
-                }
-            }
-            buf.push(s[i..].chars().next().unwrap());
-            i += s[i..].chars().next().unwrap().len_utf8();
-        }
-        if !buf.trim().is_empty() {
-            tokens.push((pos, true, buf.trim().to_string())); // Last token, operator doesn't matter
-        }
-
-        if tokens.len() > 1 {
-            let mut expr = parse_postfix(tokens[0].2.trim())?;
-            for i in 1..tokens.len() {
-                let rhs = parse_postfix(tokens[i].2.trim())?;
-                if tokens[i - 1].1 {
-                    // Previous token marked as times
-                    expr = Expr::Times(Box::new(expr), Box::new(rhs));
-                } else {
-                    expr = Expr::DividedBy(Box::new(expr), Box::new(rhs));
-                }
+    let operands = split_operands(s, MULT_OPS);
+    if operands.len() > 1 {
+        let mut expr = parse_postfix(operands[0].1)?;
+        for pair in operands.windows(2) {
+            let rhs = parse_postfix(pair[1].1)?;
+            if pair[0].0 {
+                // Previous operand was followed by times
+                expr = Expr::Times(Box::new(expr), Box::new(rhs));
+            } else {
+                expr = Expr::DividedBy(Box::new(expr), Box::new(rhs));
             }
-            return Ok(expr);
         }
+        return Ok(expr);
     }
 
     parse_postfix(s)
@@ -1135,11 +1064,12 @@ fn parse_mult(s: &str) -> Result<Expr> {
 
 fn parse_postfix(s: &str) -> Result<Expr> {
     let s = s.trim();
-    // Check for indexing: expr[index]
-    // Find the rightmost '[' at depth 0 (not inside strings or nested brackets/parens)
+    // Check for indexing: expr[index], possibly chained as expr[a][b]
+    // Record every '[' at depth 0 (not inside strings or nested brackets/parens) in one scan;
+    // each level of a chain then peels off the rightmost one instead of rescanning its base
     let mut in_str = false;
     let mut depth = 0i32;
-    let mut last_bracket = None;
+    let mut brackets = Vec::new();
 
     for (i, ch) in s.char_indices() {
         if ch == '"' {
@@ -1149,7 +1079,7 @@ fn parse_postfix(s: &str) -> Result<Expr> {
         if !in_str {
             if ch == '(' || ch == '[' || ch == '{' {
                 if depth == 0 && ch == '[' {
-                    last_bracket = Some(i);
+                    brackets.push(i);
                 }
                 depth += 1;
             } else if ch == ')' || ch == ']' || ch == '}' {
@@ -1158,148 +1088,97 @@ fn parse_postfix(s: &str) -> Result<Expr> {
         }
     }
 
-    // If we found a '[' at top level and the expression ends with ']'
-    if let Some(bracket_pos) = last_bracket {
-        if s.ends_with(']') && bracket_pos > 0 {
-            let base = &s[..bracket_pos];
-            let index_expr = &s[bracket_pos + 1..s.len() - 1];
-
-            // Recursively parse both parts
-            let base_expr = parse_postfix(base.trim())?;
-            let index = parse_expr(index_expr.trim())?;
-
-            return Ok(Expr::Index(Box::new(base_expr), Box::new(index)));
+    // Peel indices off while the remaining base ends with ']' and has a top-level '[' that
+    // is not at its start. The base is a prefix of `s`, so its brackets are a prefix of ours.
+    let mut base = s;
+    let mut indices = Vec::new();
+    while let Some(&bracket_pos) = brackets.last() {
+        if !(base.ends_with(']') && bracket_pos > 0) {
+            break;
         }
+        indices.push(&base[bracket_pos + 1..base.len() - 1]);
+        base = base[..bracket_pos].trim();
+        brackets.pop();
     }
 
-    parse_term(s)
+    let mut expr = parse_term(base)?;
+    for index_expr in indices.into_iter().rev() {
+        let index = parse_expr(index_expr.trim())?;
+        expr = Expr::Index(Box::new(expr), Box::new(index));
+    }
+    Ok(expr)
 }
 
-fn split_top_level(s: &str, delim: &str) -> Vec<String> {
-    let mut out = Vec::new();
-    let mut buf = String::new();
-    let mut in_str = false;
-    let mut depth = 0i32;
-    let bytes = s.as_bytes();
-    let mut i = 0;
-    while i < bytes.len() {
-        if bytes[i] == b'"' {
-            in_str = !in_str;
-            buf.push('"');
-            i += 1;
-            continue;
-        }
-        if !in_str {
-            if bytes[i] == b'(' || bytes[i] == b'[' || bytes[i] == b'{' {
-                depth += 1;
-                buf.push(bytes[i] as char);
-                i += 1;
-                continue;
-            }
-            if bytes[i] == b')' || bytes[i] == b']' || bytes[i] == b'}' {
-                depth -= 1;
-                buf.push(bytes[i] as char);
-                i += 1;
-                continue;
-            }
-            if depth == 0 && s[i..].starts_with(delim) {
-                out.push(buf.trim().to_string());
-                buf.clear();
-                i += delim.len();
-                continue;
-            }
-        }
-        buf.push(s[i..].chars().next().unwrap());
-        i += s[i..].chars().next().unwrap().len_utf8();
-    }
-    if !buf.trim().is_empty() {
-        out.push(buf.trim().to_string());
-    }
-    out
+fn split_top_level<'a>(s: &'a str, delim: &str) -> Vec<&'a str> {
+    split_top_level_multi(s, &[delim])
 }
 
-fn split_top_level_multi(s: &str, delims: &[&str]) -> Vec<String> {
+// Split `s` at top-level delimiters (not inside strings or brackets), returning trimmed slices
+// of `s`. Empty pieces are kept, except a trailing one.
+fn split_top_level_multi<'a>(s: &'a str, delims: &[&str]) -> Vec<&'a str> {
     let mut out = Vec::new();
-    let mut buf = String::new();
+    let bytes = s.as_bytes();
     let mut in_str = false;
     let mut depth = 0i32;
+    let mut start = 0;
     let mut i = 0;
-    while i < s.len() {
-        let ch = s[i..].chars().next().unwrap();
-        if ch == '"' {
-            in_str = !in_str;
-            buf.push(ch);
-            i += ch.len_utf8();
-            continue;
-        }
-        if !in_str {
-            if ch == '(' || ch == '[' || ch == '{' {
-                depth += 1;
-                buf.push(ch);
-                i += 1;
-                continue;
-            }
-            if ch == ')' || ch == ']' || ch == '}' {
-                depth -= 1;
-                buf.push(ch);
-                i += 1;
-                continue;
-            }
-            if depth == 0 {
-                let mut matched = None;
+    'scan: while i < bytes.len() {
+        match bytes[i] {
+            b'"' => in_str = !in_str,
+            b'(' | b'[' | b'{' if !in_str => depth += 1,
+            b')' | b']' | b'}' if !in_str => depth -= 1,
+            _ if !in_str && depth == 0 => {
                 for d in delims {
-                    if s[i..].starts_with(d) {
-                        matched = Some(*d);
-                        break;
+                    if bytes[i..].starts_with(d.as_bytes()) {
+                        out.push(s[start..i].trim());
+                        i += d.len();
+                        start = i;
+                        continue 'scan;
                     }
                 }
-                if let Some(d) = matched {
-                    out.push(buf.trim().to_string());
-                    buf.clear();
-                    i += d.len();
-                    continue;
-                }
             }
+            _ => {}
         }
-        buf.push(ch);
-        i += ch.len_utf8();
+        // UTF-8 is self-synchronising, so a delimiter can only match on a char boundary
+        i += 1;
     }
-    if !buf.trim().is_empty() {
-        out.push(buf.trim().to_string());
+    let last = s[start..].trim();
+    if !last.is_empty() {
+        out.push(last);
     }
     out
 }
 
 fn split_once_top_level<'a>(s: &'a str, pat: &str) -> Option<(&'a str, &'a str)> {
+    // A pattern starting with a quote or bracket is consumed as structure, never matched
+    if matches!(
+        pat.as_bytes().first(),
+        None | Some(b'"' | b'(' | b')' | b'[' | b']' | b'{' | b'}')
+    ) {
+        return None;
+    }
+    // Jump between candidate matches with `find`, only tracking string and bracket state over
+    // the bytes in between. Most patterns do not occur at all and cost a single search.
+    let bytes = s.as_bytes();
     let mut in_str = false;
     let mut depth = 0i32;
-    let bytes = s.as_bytes();
-    let mut i = 0;
-    while i + pat.len() <= bytes.len() {
-        let ch = s[i..].chars().next().unwrap();
-        if ch == '"' {
-            in_str = !in_str;
-            i += ch.len_utf8();
-            continue;
-        }
-        if !in_str {
-            if ch == '(' || ch == '[' || ch == '{' {
-                depth += 1;
-                i += 1;
-                continue;
-            }
-            if ch == ')' || ch == ']' || ch == '}' {
-                depth -= 1;
-                i += 1;
-                continue;
-            }
-            if depth == 0 && s[i..].starts_with(pat) {
-                let (l, r) = s.split_at(i);
-                let r = &r[pat.len()..];
-                return Some((l, r));
+    let mut scanned = 0;
+    let mut from = 0;
+    while let Some(off) = s[from..].find(pat) {
+        let pos = from + off;
+        for &b in &bytes[scanned..pos] {
+            match b {
+                b'"' => in_str = !in_str,
+                b'(' | b'[' | b'{' if !in_str => depth += 1,
+                b')' | b']' | b'}' if !in_str => depth -= 1,
+                _ => {}
             }
         }
-        i += ch.len_utf8();
+        scanned = pos;
+        if !in_str && depth == 0 {
+            return Some((&s[..pos], &s[pos + pat.len()..]));
+        }
+        from = pos + s[pos..].chars().next().unwrap().len_utf8();
     }
     None
 }
@@ -1309,7 +1188,7 @@ fn split_once_top_level<'a>(s: &'a str, pat: &str) -> Option<(&'a str, &'a str)>
 // Helper: parse a comma/" and " separated list of expressions at top level.
 fn parse_items_comma_or_and(s: &str) -> Result<Vec<Expr>> {
     let parts = split_top_level_multi(s, &[",", " and "]);
-    let mut out = Vec::new();
+    let mut out = Vec::with_capacity(parts.len());
     for p in parts {
         let t = p.trim();
         if t.is_empty() {
@@ -1326,6 +1205,111 @@ fn parse_term(s: &str) -> Result<Expr> {
         return Err(anyhow!("Empty expression"));
     }
 
+    // String literal. Checked first: no phrasal prefix can start with a quote, so the
+    // literal is built straight from the source slice without probing every phrase.
+    if (s.starts_with('"') && s.ends_with('"') && s.len() >= 2)
+        || (s.starts_with('\'') && s.ends_with('\'') && s.len() >= 2)
+    {
+        return Ok(Expr::Str(s[1..s.len() - 1].to_string()));
+    }
+
+    // Every phrasal form starts with a letter (or is a rejected bracket/brace literal), so
+    // numbers and parenthesised groups skip the prefix probes entirely. Every phrase is also
+    // more than one word, so a bare identifier (no space) cannot match any of them.
+    let head = s.as_bytes()[0];
+    if head == b'[' || head == b'{' || (head.is_ascii_alphabetic() && s.contains(' ')) {
+        if let Some(expr) = parse_phrasal_term(s)? {
+            return Ok(expr);
+        }
+    }
+
+    // Numeric literal. A term starting with a digit, sign or point cannot be a keyword or a
+    // legacy literal, so it is tried as a number straight away.
+    if head.is_ascii_digit() || matches!(head, b'-' | b'+' | b'.') {
+        if let Ok(n) = s.parse::<f64>() {
+            return Ok(Expr::Num(n));
+        }
+    }
+
+    // Booleans
+    if s.eq_ignore_ascii_case("True") {
+        return Ok(Expr::Bool(true));
+    }
+    if s.eq_ignore_ascii_case("False") {
+        return Ok(Expr::Bool(false));
+    }
+    // Null/None
+    if s.eq_ignore_ascii_case("Null") || s.eq_ignore_ascii_case("Nothing") || s == "None" {
+        return Ok(Expr::Null);
+    }
+    // Legacy list syntax is NOT supported
+    if let Some(_rest) = strip_prefix_ci(s, "List contains ") {
+        return Err(anyhow!("Legacy 'List contains' is not supported. Use: Make a list of ..."));
+    }
+    // Legacy dictionary syntax is NOT supported
+    if let Some(_rest) = strip_prefix_ci(s, "Dictionary contains ") {
+        return Err(anyhow!("Legacy 'Dictionary contains' is not supported. Use: Make a dictionary with ..."));
+    }
+    // Number
+    if let Ok(n) = s.parse::<f64>() {
+        return Ok(Expr::Num(n));
+    }
+    // Phrasal call: name with args
+    if let Some((name, after)) = split_ident_str(s) {
+        let after = after.trim_start();
+        if let Some(rest) = after.strip_prefix("with ") {
+            let args = if rest.trim().is_empty() {
+                vec![]
+            } else {
+                parse_arg_list_multi(rest, true)?
+            };
+            return Ok(Expr::Call {
+                name: name.to_string(),
+                args,
+            });
+        }
+    }
+    // Call form: name(args) OR grouping: (expr)
+    if let Some(idx) = s.find('(') {
+        if s.ends_with(')') {
+            let name = s[..idx].trim();
+            let args_str = &s[idx + 1..s.len() - 1];
+            
+            // If name is empty, this is a grouping expression: (expr)
+            if name.is_empty() {
+                let inner = args_str.trim();
+                if inner.is_empty() {
+                    return Err(anyhow!("Empty parentheses () are not allowed"));
+                }
+                // Parse the grouped expression recursively
+                return parse_expr(inner);
+            }
+            
+            // Otherwise, it's a function call: name(args)
+            let args = if args_str.trim().is_empty() {
+                vec![]
+            } else {
+                parse_arg_list(args_str)?
+            };
+            return Ok(Expr::Call {
+                name: name.to_string(),
+                args,
+            });
+        }
+    }
+    // Identifier
+    if let Some((id, rest)) = split_ident_str(s) {
+        if rest.trim().is_empty() {
+            return Ok(Expr::Ident(id.to_string()));
+        }
+    }
+    let error_msg = format!("Could not parse expression: {}", s);
+    Err(anyhow!(suggest_fix(&error_msg, s)))
+}
+
+// Phrasal term forms (built-ins, collection/file/JSON/error/web phrases and phrasal literals).
+// Returns Ok(None) when `s` does not start with any known phrase.
+fn parse_phrasal_term(s: &str) -> Result<Option<Expr>> {
     // Phrasal list literals (immutable/mutable): Make a (mutable) list of 1, 2 and 3
     if let Some(rest) = strip_prefix_ci(s, "Make a mutable list of ") {
         let items = if rest.trim().is_empty() {
@@ -1334,7 +1318,7 @@ fn parse_term(s: &str) -> Result<Expr> {
             parse_items_comma_or_and(rest)?
         };
         // TODO: track mutability; for now, same ListLit representation.
-        return Ok(Expr::ListLit(items));
+        return Ok(Some(Expr::ListLit(items)));
     }
     if let Some(rest) = strip_prefix_ci(s, "Make a list of ") {
         let items = if rest.trim().is_empty() {
@@ -1342,139 +1326,87 @@ fn parse_term(s: &str) -> Result<Expr> {
         } else {
             parse_items_comma_or_and(rest)?
         };
-        return Ok(Expr::ListLit(items));
+        return Ok(Some(Expr::ListLit(items)));
     }
 
     // Phrasal dictionary literals (immutable/mutable): Make a (mutable) dictionary with "a" as 1 and "b" as 2
     if let Some(rest) = strip_prefix_ci(s, "Make a mutable dictionary with ") {
-        let mut pairs = Vec::new();
-        let mut r = rest.trim();
-        while !r.is_empty() {
-            // split key and remainder by ' as ' (or legacy ' set to ')
-            let (kpart, after_key) = if let Some((k, a)) = split_once_top_level(r, " as ") {
-                (k, a)
-            } else if let Some((k, a)) = split_once_top_level(r, " set to ") {
-                (k, a)
-            } else {
-                return Err(anyhow!("Expected 'as' in dictionary literal item"));
-            };
-            let kstr = extract_quoted(kpart.trim())
-                .ok_or_else(|| anyhow!("Expected quoted key in dictionary literal"))?;
-            // find next delimiter (either ' and ' or ',') at top level to terminate the value expression
-            let (vpart, rest_after_val) =
-                if let Some((v, after)) = split_once_top_level(after_key, " and ") {
-                    (v.trim(), Some(after))
-                } else if let Some((v, after)) = split_once_top_level(after_key, ",") {
-                    (v.trim(), Some(after))
-                } else {
-                    (after_key.trim(), None)
-                };
-            let vexpr = parse_expr(vpart)?;
-            pairs.push((kstr, vexpr));
-            r = match rest_after_val {
-                Some(a) => a.trim(),
-                None => "",
-            };
-        }
         // TODO: track mutability; for now, same DictLit representation.
-        return Ok(Expr::DictLit(pairs));
+        return Ok(Some(Expr::DictLit(parse_dict_items(rest)?)));
     }
     if let Some(rest) = strip_prefix_ci(s, "Make a dictionary with ") {
-        let mut pairs = Vec::new();
-        let mut r = rest.trim();
-        while !r.is_empty() {
-            let (kpart, after_key) = if let Some((k, a)) = split_once_top_level(r, " as ") {
-                (k, a)
-            } else if let Some((k, a)) = split_once_top_level(r, " set to ") {
-                (k, a)
-            } else {
-                return Err(anyhow!("Expected 'as' in dictionary literal item"));
-            };
-            let kstr = extract_quoted(kpart.trim())
-                .ok_or_else(|| anyhow!("Expected quoted key in dictionary literal"))?;
-            let (vpart, rest_after_val) =
-                if let Some((v, after)) = split_once_top_level(after_key, " and ") {
-                    (v.trim(), Some(after))
-                } else if let Some((v, after)) = split_once_top_level(after_key, ",") {
-                    (v.trim(), Some(after))
-                } else {
-                    (after_key.trim(), None)
-                };
-            let vexpr = parse_expr(vpart)?;
-            pairs.push((kstr, vexpr));
-            r = match rest_after_val {
-                Some(a) => a.trim(),
-                None => "",
-            };
-        }
-        return Ok(Expr::DictLit(pairs));
+        return Ok(Some(Expr::DictLit(parse_dict_items(rest)?)));
     }
 
     // Bracket list literals are NOT supported - use phrasal syntax
     if s.starts_with('[') && s.ends_with(']') {
-        return Err(anyhow!("Bracket list literals '[]' are not supported. Use: Make a list of ..."));
+        return Err(anyhow!(
+            "Bracket list literals '[]' are not supported. Use: Make a list of ..."
+        ));
     }
 
     // Brace dict literals are NOT supported - use phrasal syntax
     if s.starts_with('{') && s.ends_with('}') {
-        return Err(anyhow!("Brace dictionary literals '{{}}' are not supported. Use: Make a dictionary with ..."));
+        return Err(anyhow!(
+            "Brace dictionary literals '{{}}' are not supported. Use: Make a dictionary with ..."
+        ));
     }
 
     // Phrasal built-in expressions (case-insensitive)
     if let Some(rest) = P::strip_prefix_ci(s, P::P_COUNT_OF) {
-        return Ok(Expr::CountOf(Box::new(parse_expr(rest)?)));
+        return Ok(Some(Expr::CountOf(Box::new(parse_expr(rest)?))));
     }
     if let Some(rest) = P::strip_prefix_ci(s, P::P_TOTAL_OF) {
-        return Ok(Expr::TotalOf(Box::new(parse_expr(rest)?)));
+        return Ok(Some(Expr::TotalOf(Box::new(parse_expr(rest)?))));
     }
     if let Some(rest) = P::strip_prefix_ci(s, P::P_SMALLEST_IN) {
-        return Ok(Expr::SmallestIn(Box::new(parse_expr(rest)?)));
+        return Ok(Some(Expr::SmallestIn(Box::new(parse_expr(rest)?))));
     }
     if let Some(rest) = P::strip_prefix_ci(s, P::P_LARGEST_IN) {
-        return Ok(Expr::LargestIn(Box::new(parse_expr(rest)?)));
+        return Ok(Some(Expr::LargestIn(Box::new(parse_expr(rest)?))));
     }
     if let Some(rest) = P::strip_prefix_ci(s, P::P_ABS_OF) {
-        return Ok(Expr::AbsoluteValueOf(Box::new(parse_expr(rest)?)));
+        return Ok(Some(Expr::AbsoluteValueOf(Box::new(parse_expr(rest)?))));
     }
     if let Some(rest) = P::strip_prefix_ci(s, P::P_ROUND_DOWN) {
-        return Ok(Expr::RoundDown(Box::new(parse_expr(rest)?)));
+        return Ok(Some(Expr::RoundDown(Box::new(parse_expr(rest)?))));
     }
     if let Some(rest) = P::strip_prefix_ci(s, P::P_ROUND_UP) {
-        return Ok(Expr::RoundUp(Box::new(parse_expr(rest)?)));
+        return Ok(Some(Expr::RoundUp(Box::new(parse_expr(rest)?))));
     }
     if let Some(rest) = P::strip_prefix_ci(s, P::P_ROUND) {
-        return Ok(Expr::Round(Box::new(parse_expr(rest)?)));
+        return Ok(Some(Expr::Round(Box::new(parse_expr(rest)?))));
     }
     if let Some(rest) = P::strip_prefix_ci(s, P::P_MAKE_UPPER) {
-        return Ok(Expr::MakeUppercase(Box::new(parse_expr(rest)?)));
+        return Ok(Some(Expr::MakeUppercase(Box::new(parse_expr(rest)?))));
     }
     if let Some(rest) = P::strip_prefix_ci(s, P::P_MAKE_LOWER) {
-        return Ok(Expr::MakeLowercase(Box::new(parse_expr(rest)?)));
+        return Ok(Some(Expr::MakeLowercase(Box::new(parse_expr(rest)?))));
     }
     if let Some(rest) = P::strip_prefix_ci(s, P::P_TRIM_FROM) {
-        return Ok(Expr::TrimSpaces(Box::new(parse_expr(rest)?)));
+        return Ok(Some(Expr::TrimSpaces(Box::new(parse_expr(rest)?))));
     }
     if let Some(rest) = P::strip_prefix_ci(s, P::P_FIRST_IN) {
-        return Ok(Expr::FirstIn(Box::new(parse_expr(rest)?)));
+        return Ok(Some(Expr::FirstIn(Box::new(parse_expr(rest)?))));
     }
     if let Some(rest) = P::strip_prefix_ci(s, P::P_LAST_IN) {
-        return Ok(Expr::LastIn(Box::new(parse_expr(rest)?)));
+        return Ok(Some(Expr::LastIn(Box::new(parse_expr(rest)?))));
     }
     if let Some(rest) = P::strip_prefix_ci(s, P::P_REVERSE_OF) {
-        return Ok(Expr::ReverseOf(Box::new(parse_expr(rest)?)));
+        return Ok(Some(Expr::ReverseOf(Box::new(parse_expr(rest)?))));
     }
     // Aliases for friendliness
     if let Some(rest) = P::strip_prefix_ci(s, P::P_REVERSE_ALIAS) {
         // alias of "reverse of"
-        return Ok(Expr::ReverseOf(Box::new(parse_expr(rest)?)));
+        return Ok(Some(Expr::ReverseOf(Box::new(parse_expr(rest)?))));
     }
     if let Some(rest) = P::strip_prefix_ci(s, P::P_CLEAN_ALIAS) {
         // alias of "trim spaces from"
-        return Ok(Expr::TrimSpaces(Box::new(parse_expr(rest)?)));
+        return Ok(Some(Expr::TrimSpaces(Box::new(parse_expr(rest)?))));
     }
     // New aliases
     if let Some(rest) = P::strip_prefix_ci(s, P::P_SIZE_OF) {
-        return Ok(Expr::CountOf(Box::new(parse_expr(rest)?)));
+        return Ok(Some(Expr::CountOf(Box::new(parse_expr(rest)?))));
     }
 
     // Phrasal binary built-ins: join <list> with <sep>
@@ -1482,7 +1414,7 @@ fn parse_term(s: &str) -> Result<Expr> {
         if let Some((lhs, rhs)) = split_once_top_level(rest, P::P_JOIN_WITH) {
             let a = parse_expr(lhs.trim())?;
             let b = parse_expr(rhs.trim())?;
-            return Ok(Expr::JoinWith(Box::new(a), Box::new(b)));
+            return Ok(Some(Expr::JoinWith(Box::new(a), Box::new(b))));
         }
     }
     // split <text> by <sep>
@@ -1490,7 +1422,7 @@ fn parse_term(s: &str) -> Result<Expr> {
         if let Some((lhs, rhs)) = split_once_top_level(rest, P::P_SPLIT_BY) {
             let a = parse_expr(lhs.trim())?;
             let b = parse_expr(rhs.trim())?;
-            return Ok(Expr::SplitBy(Box::new(a), Box::new(b)));
+            return Ok(Some(Expr::SplitBy(Box::new(a), Box::new(b))));
         }
     }
     // separate <text> by <sep> (alias of split)
@@ -1498,7 +1430,7 @@ fn parse_term(s: &str) -> Result<Expr> {
         if let Some((lhs, rhs)) = split_once_top_level(rest, P::P_SPLIT_BY) {
             let a = parse_expr(lhs.trim())?;
             let b = parse_expr(rhs.trim())?;
-            return Ok(Expr::SplitBy(Box::new(a), Box::new(b)));
+            return Ok(Some(Expr::SplitBy(Box::new(a), Box::new(b))));
         }
     }
 
@@ -1507,7 +1439,10 @@ fn parse_term(s: &str) -> Result<Expr> {
         if let Some((item, collection)) = split_once_top_level(rest, P::P_CONTAINS_IN) {
             let item_expr = parse_expr(item.trim())?;
             let coll_expr = parse_expr(collection.trim())?;
-            return Ok(Expr::Contains(Box::new(item_expr), Box::new(coll_expr)));
+            return Ok(Some(Expr::Contains(
+                Box::new(item_expr),
+                Box::new(coll_expr),
+            )));
         }
     }
     // remove <item> from <list>
@@ -1515,7 +1450,7 @@ fn parse_term(s: &str) -> Result<Expr> {
         if let Some((item, list)) = split_once_top_level(rest, P::P_REMOVE_FROM) {
             let item_expr = parse_expr(item.trim())?;
             let list_expr = parse_expr(list.trim())?;
-            return Ok(Expr::Remove(Box::new(item_expr), Box::new(list_expr)));
+            return Ok(Some(Expr::Remove(Box::new(item_expr), Box::new(list_expr))));
         }
     }
     // append <item> to <list>
@@ -1523,7 +1458,7 @@ fn parse_term(s: &str) -> Result<Expr> {
         if let Some((item, list)) = split_once_top_level(rest, P::P_APPEND_TO) {
             let item_expr = parse_expr(item.trim())?;
             let list_expr = parse_expr(list.trim())?;
-            return Ok(Expr::Append(Box::new(item_expr), Box::new(list_expr)));
+            return Ok(Some(Expr::Append(Box::new(item_expr), Box::new(list_expr))));
         }
     }
     // insert <item> at <index> in <list>
@@ -1535,11 +1470,11 @@ fn parse_term(s: &str) -> Result<Expr> {
                 let item_expr = parse_expr(item.trim())?;
                 let index_expr = parse_expr(index.trim())?;
                 let list_expr = parse_expr(list.trim())?;
-                return Ok(Expr::InsertAt(
+                return Ok(Some(Expr::InsertAt(
                     Box::new(item_expr),
                     Box::new(index_expr),
                     Box::new(list_expr),
-                ));
+                )));
             }
         }
     }
@@ -1547,40 +1482,43 @@ fn parse_term(s: &str) -> Result<Expr> {
     // File I/O operations
     // read file at <path>
     if let Some(rest) = P::strip_prefix_ci(s, P::P_READ_FILE) {
-        return Ok(Expr::ReadFile(Box::new(parse_expr(rest)?)));
+        return Ok(Some(Expr::ReadFile(Box::new(parse_expr(rest)?))));
     }
     // read lines from file at <path> or read lines from <path>
     if let Some(rest) = P::strip_prefix_ci(s, P::P_READ_LINES) {
-        return Ok(Expr::ReadLines(Box::new(parse_expr(rest)?)));
+        return Ok(Some(Expr::ReadLines(Box::new(parse_expr(rest)?))));
     }
     if let Some(rest) = P::strip_prefix_ci(s, P::P_READ_LINES_ALT) {
-        return Ok(Expr::ReadLines(Box::new(parse_expr(rest)?)));
+        return Ok(Some(Expr::ReadLines(Box::new(parse_expr(rest)?))));
     }
     // file exists at <path>
     if let Some(rest) = P::strip_prefix_ci(s, P::P_FILE_EXISTS) {
-        return Ok(Expr::FileExists(Box::new(parse_expr(rest)?)));
+        return Ok(Some(Expr::FileExists(Box::new(parse_expr(rest)?))));
     }
     // delete file at <path>
     if let Some(rest) = P::strip_prefix_ci(s, P::P_DELETE_FILE) {
-        return Ok(Expr::DeleteFile(Box::new(parse_expr(rest)?)));
+        return Ok(Some(Expr::DeleteFile(Box::new(parse_expr(rest)?))));
     }
     // create directory at <path>
     if let Some(rest) = P::strip_prefix_ci(s, P::P_CREATE_DIR) {
-        return Ok(Expr::CreateDir(Box::new(parse_expr(rest)?)));
+        return Ok(Some(Expr::CreateDir(Box::new(parse_expr(rest)?))));
     }
     // list files in directory at <path> or list files in <path>
     if let Some(rest) = P::strip_prefix_ci(s, P::P_LIST_DIR_ALT) {
-        return Ok(Expr::ListDir(Box::new(parse_expr(rest)?)));
+        return Ok(Some(Expr::ListDir(Box::new(parse_expr(rest)?))));
     }
     if let Some(rest) = P::strip_prefix_ci(s, P::P_LIST_DIR) {
-        return Ok(Expr::ListDir(Box::new(parse_expr(rest)?)));
+        return Ok(Some(Expr::ListDir(Box::new(parse_expr(rest)?))));
     }
     // write <content> to file at <path>
     if let Some(rest) = P::strip_prefix_ci(s, P::P_WRITE_FILE) {
         if let Some((content, path)) = split_once_top_level(rest, P::P_WRITE_TO_FILE) {
             let content_expr = parse_expr(content.trim())?;
             let path_expr = parse_expr(path.trim())?;
-            return Ok(Expr::WriteFile(Box::new(content_expr), Box::new(path_expr)));
+            return Ok(Some(Expr::WriteFile(
+                Box::new(content_expr),
+                Box::new(path_expr),
+            )));
         }
     }
     // append <content> to file at <path>
@@ -1588,10 +1526,10 @@ fn parse_term(s: &str) -> Result<Expr> {
         if let Some((content, path)) = split_once_top_level(rest, P::P_APPEND_TO_FILE) {
             let content_expr = parse_expr(content.trim())?;
             let path_expr = parse_expr(path.trim())?;
-            return Ok(Expr::AppendFile(
+            return Ok(Some(Expr::AppendFile(
                 Box::new(content_expr),
                 Box::new(path_expr),
-            ));
+            )));
         }
     }
     // copy file from <source> to <dest>
@@ -1599,7 +1537,10 @@ fn parse_term(s: &str) -> Result<Expr> {
         if let Some((source, dest)) = split_once_top_level(rest, P::P_COPY_TO) {
             let source_expr = parse_expr(source.trim())?;
             let dest_expr = parse_expr(dest.trim())?;
-            return Ok(Expr::CopyFile(Box::new(source_expr), Box::new(dest_expr)));
+            return Ok(Some(Expr::CopyFile(
+                Box::new(source_expr),
+                Box::new(dest_expr),
+            )));
         }
     }
     // move file from <source> to <dest>
@@ -1607,41 +1548,44 @@ fn parse_term(s: &str) -> Result<Expr> {
         if let Some((source, dest)) = split_once_top_level(rest, P::P_COPY_TO) {
             let source_expr = parse_expr(source.trim())?;
             let dest_expr = parse_expr(dest.trim())?;
-            return Ok(Expr::MoveFile(Box::new(source_expr), Box::new(dest_expr)));
+            return Ok(Some(Expr::MoveFile(
+                Box::new(source_expr),
+                Box::new(dest_expr),
+            )));
         }
     }
 
     // JSON operations
     // parse json from <string>
     if let Some(rest) = P::strip_prefix_ci(s, P::P_PARSE_JSON) {
-        return Ok(Expr::ParseJson(Box::new(parse_expr(rest)?)));
+        return Ok(Some(Expr::ParseJson(Box::new(parse_expr(rest)?))));
     }
     // convert to json <value>
     if let Some(rest) = P::strip_prefix_ci(s, P::P_TO_JSON) {
-        return Ok(Expr::ToJson(Box::new(parse_expr(rest)?)));
+        return Ok(Some(Expr::ToJson(Box::new(parse_expr(rest)?))));
     }
     // convert to pretty json <value>
     if let Some(rest) = P::strip_prefix_ci(s, P::P_JSON_PRETTY) {
-        return Ok(Expr::ToJsonPretty(Box::new(parse_expr(rest)?)));
+        return Ok(Some(Expr::ToJsonPretty(Box::new(parse_expr(rest)?))));
     }
     // json length of <value>
     if let Some(rest) = P::strip_prefix_ci(s, P::P_JSON_LENGTH) {
-        return Ok(Expr::JsonLength(Box::new(parse_expr(rest)?)));
+        return Ok(Some(Expr::JsonLength(Box::new(parse_expr(rest)?))));
     }
     // new json object
     if s.eq_ignore_ascii_case(P::P_NEW_JSON_OBJECT) {
-        return Ok(Expr::NewJsonObject);
+        return Ok(Some(Expr::NewJsonObject));
     }
     // new json array
     if s.eq_ignore_ascii_case(P::P_NEW_JSON_ARRAY) {
-        return Ok(Expr::NewJsonArray);
+        return Ok(Some(Expr::NewJsonArray));
     }
     // get <key> from json <object>
     if let Some(rest) = P::strip_prefix_ci(s, P::P_JSON_GET) {
         if let Some((key, json)) = split_once_top_level(rest, P::P_JSON_FROM) {
             let key_expr = parse_expr(key.trim())?;
             let json_expr = parse_expr(json.trim())?;
-            return Ok(Expr::JsonGet(Box::new(json_expr), Box::new(key_expr)));
+            return Ok(Some(Expr::JsonGet(Box::new(json_expr), Box::new(key_expr))));
         }
     }
     // set <key> in json <object> to <value>
@@ -1651,11 +1595,11 @@ fn parse_term(s: &str) -> Result<Expr> {
                 let key_expr = parse_expr(key_part.trim())?;
                 let json_expr = parse_expr(json_part.trim())?;
                 let value_expr = parse_expr(value_part.trim())?;
-                return Ok(Expr::JsonSet(
+                return Ok(Some(Expr::JsonSet(
                     Box::new(json_expr),
                     Box::new(key_expr),
                     Box::new(value_expr),
-                ));
+                )));
             }
         }
     }
@@ -1664,18 +1608,21 @@ fn parse_term(s: &str) -> Result<Expr> {
         if let Some((item, json)) = split_once_top_level(rest, P::P_JSON_PUSH_TO) {
             let item_expr = parse_expr(item.trim())?;
             let json_expr = parse_expr(json.trim())?;
-            return Ok(Expr::JsonPush(Box::new(json_expr), Box::new(item_expr)));
+            return Ok(Some(Expr::JsonPush(
+                Box::new(json_expr),
+                Box::new(item_expr),
+            )));
         }
     }
 
     // Error operations
     // error message of <error>
     if let Some(rest) = P::strip_prefix_ci(s, P::P_ERROR_MESSAGE) {
-        return Ok(Expr::ErrorMessage(Box::new(parse_expr(rest)?)));
+        return Ok(Some(Expr::ErrorMessage(Box::new(parse_expr(rest)?))));
     }
     // error type of <error>
     if let Some(rest) = P::strip_prefix_ci(s, P::P_ERROR_TYPE) {
-        return Ok(Expr::ErrorType(Box::new(parse_expr(rest)?)));
+        return Ok(Some(Expr::ErrorType(Box::new(parse_expr(rest)?))));
     }
     // error of type <type> with message <message>
     if let Some(rest) = P::strip_prefix_ci(s, "error of type ") {
@@ -1690,21 +1637,21 @@ fn parse_term(s: &str) -> Result<Expr> {
                 error_type
             };
             let message_expr = parse_expr(message_part.trim())?;
-            return Ok(Expr::NewError {
+            return Ok(Some(Expr::NewError {
                 error_type: error_type_clean.to_string(),
                 message: Box::new(message_expr),
-            });
+            }));
         }
     }
 
     // Web Framework Expressions
     // create web server on port <port>
     if let Some(rest) = P::strip_prefix_ci(s, "create web server on port ") {
-        return Ok(Expr::CreateWebServer(Box::new(parse_expr(rest)?)));
+        return Ok(Some(Expr::CreateWebServer(Box::new(parse_expr(rest)?))));
     }
     // html response with <content>
     if let Some(rest) = P::strip_prefix_ci(s, "html response with ") {
-        return Ok(Expr::HtmlResponse(Box::new(parse_expr(rest)?)));
+        return Ok(Some(Expr::HtmlResponse(Box::new(parse_expr(rest)?))));
     }
     // json response with <data>
     if let Some(rest) = P::strip_prefix_ci(s, "json response with ") {
@@ -1712,118 +1659,63 @@ fn parse_term(s: &str) -> Result<Expr> {
         if let Some((data_part, status_part)) = split_once_top_level(rest, " and status ") {
             let data_expr = parse_expr(data_part.trim())?;
             let status_expr = parse_expr(status_part.trim())?;
-            return Ok(Expr::JsonResponseStatus(
+            return Ok(Some(Expr::JsonResponseStatus(
                 Box::new(data_expr),
                 Box::new(status_expr),
-            ));
+            )));
         }
-        return Ok(Expr::JsonResponse(Box::new(parse_expr(rest)?)));
+        return Ok(Some(Expr::JsonResponse(Box::new(parse_expr(rest)?))));
     }
     // render template <template> with <data>
     if let Some(rest) = P::strip_prefix_ci(s, "render template ") {
         if let Some((template_part, data_part)) = split_once_top_level(rest, " with ") {
             let template_expr = parse_expr(template_part.trim())?;
             let data_expr = parse_expr(data_part.trim())?;
-            return Ok(Expr::RenderTemplate(
+            return Ok(Some(Expr::RenderTemplate(
                 Box::new(template_expr),
                 Box::new(data_expr),
-            ));
+            )));
         }
     }
     // get path parameter <name>
     if let Some(rest) = P::strip_prefix_ci(s, P::P_GET_PATH_PARAM) {
         let param_expr = parse_expr(rest.trim())?;
-        return Ok(Expr::GetPathParam(Box::new(param_expr)));
+        return Ok(Some(Expr::GetPathParam(Box::new(param_expr))));
     }
     // error response with status <status> and message <message>
     if let Some(rest) = P::strip_prefix_ci(s, "error response with status ") {
         if let Some((status_part, message_part)) = split_once_top_level(rest, " and message ") {
             let status_expr = parse_expr(status_part.trim())?;
             let message_expr = parse_expr(message_part.trim())?;
-            return Ok(Expr::ErrorResponse(
+            return Ok(Some(Expr::ErrorResponse(
                 Box::new(status_expr),
                 Box::new(message_expr),
-            ));
+            )));
         }
     }
 
-    // String literal
-    if (s.starts_with('"') && s.ends_with('"') && s.len() >= 2)
-        || (s.starts_with('\'') && s.ends_with('\'') && s.len() >= 2)
-    {
-        return Ok(Expr::Str(s[1..s.len() - 1].to_string()));
-    }
-    // Booleans
-    if s.eq_ignore_ascii_case("True") {
-        return Ok(Expr::Bool(true));
-    }
-    if s.eq_ignore_ascii_case("False") {
-        return Ok(Expr::Bool(false));
-    }
-    // Null/None
-    if s.eq_ignore_ascii_case("Null") || s.eq_ignore_ascii_case("Nothing") || s == "None" {
-        return Ok(Expr::Null);
-    }
-    // Legacy list syntax is NOT supported
-    if let Some(_rest) = strip_prefix_ci(s, "List contains ") {
-        return Err(anyhow!("Legacy 'List contains' is not supported. Use: Make a list of ..."));
-    }
-    // Legacy dictionary syntax is NOT supported
-    if let Some(_rest) = strip_prefix_ci(s, "Dictionary contains ") {
-        return Err(anyhow!("Legacy 'Dictionary contains' is not supported. Use: Make a dictionary with ..."));
-    }
-    // Number
-    if let Ok(n) = s.parse::<f64>() {
-        return Ok(Expr::Num(n));
-    }
-    // Phrasal call: name with args
-    if let Some((name, after)) = split_ident(s) {
-        let after = after.trim_start();
-        if let Some(rest) = after.strip_prefix("with ") {
-            let args = if rest.trim().is_empty() {
-                vec![]
-            } else {
-                parse_arg_list_multi(rest, true)?
-            };
-            return Ok(Expr::Call { name, args });
-        }
-    }
-    // Call form: name(args) OR grouping: (expr)
-    if let Some(idx) = s.find('(') {
-        if s.ends_with(')') {
-            let name = s[..idx].trim();
-            let args_str = &s[idx + 1..s.len() - 1];
-            
-            // If name is empty, this is a grouping expression: (expr)
-            if name.is_empty() {
-                let inner = args_str.trim();
-                if inner.is_empty() {
-                    return Err(anyhow!("Empty parentheses () are not allowed"));
-                }
-                // Parse the grouped expression recursively
-                return parse_expr(inner);
-            }
-            
-            // Otherwise, it's a function call: name(args)
-            let args = if args_str.trim().is_empty() {
-                vec![]
-            } else {
-                parse_arg_list(args_str)?
-            };
-            return Ok(Expr::Call {
-                name: name.to_string(),
-                args,
-            });
-        }
-    }
-    // Identifier
-    if let Some((id, rest)) = split_ident(s) {
-        if rest.trim().is_empty() {
-            return Ok(Expr::Ident(id));
-        }
-    }
-    let error_msg = format!("Could not parse expression: {}", s);
-    Err(anyhow!("{}", suggest_fix(&error_msg, s)))
+    Ok(None)
+}
+
+// Parse the items of a phrasal dictionary literal: "a" as 1 and "b" as 2 (or "a" set to 1, ...)
+fn parse_dict_items(rest: &str) -> Result<Vec<(String, Expr)>> {
+    let mut pairs = Vec::new();
+    let mut r = rest.trim();
+    while !r.is_empty() {
+        // split key and remainder by ' as ' (or legacy ' set to ')
+        let (kpart, after_key) = split_once_top_level(r, " as ")
+            .or_else(|| split_once_top_level(r, " set to "))
+            .ok_or_else(|| anyhow!("Expected 'as' in dictionary literal item"))?;
+        let kstr = extract_quoted(kpart.trim())
+            .ok_or_else(|| anyhow!("Expected quoted key in dictionary literal"))?;
+        // find next delimiter (either ' and ' or ',') at top level to terminate the value expression
+        let (vpart, rest_after_val) = split_once_top_level(after_key, " and ")
+            .or_else(|| split_once_top_level(after_key, ","))
+            .unwrap_or((after_key, ""));
+        pairs.push((kstr, parse_expr(vpart.trim())?));
+        r = rest_after_val.trim();
+    }
+    Ok(pairs)
 }
 
 fn extract_quoted(s: &str) -> Option<String> {
@@ -1881,3 +1773,171 @@ fn parse_exposing_list(s: &str) -> Result<Vec<String>> {
     }
     Ok(names)
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    // Expr has no PartialEq, so trees are compared through their Debug form
+    fn parsed(s: &str) -> String {
+        format!("{:?}", parse_expr(s).unwrap())
+    }
+
+    // parse_or splits on " or " before comparisons are reached, so the operator table is
+    // exercised on parse_cmp directly
+    fn cmp(s: &str) -> String {
+        format!("{:?}", parse_cmp(s).unwrap())
+    }
+
+    #[test]
+    fn test_cmp_longest_phrase_wins() {
+        assert_eq!(
+            cmp("a is greater than or equal to b"),
+            r#"Cmp(Ge, Ident("a"), Ident("b"))"#
+        );
+        assert_eq!(
+            cmp("a Is Less Than Or Equal To b"),
+            r#"Cmp(Le, Ident("a"), Ident("b"))"#
+        );
+        assert_eq!(
+            cmp("a is greater than b"),
+            r#"Cmp(Gt, Ident("a"), Ident("b"))"#
+        );
+        assert_eq!(
+            cmp("a is not equal to b"),
+            r#"Cmp(Ne, Ident("a"), Ident("b"))"#
+        );
+    }
+
+    #[test]
+    fn test_cmp_is_not_is_ne() {
+        assert_eq!(cmp("a is not b"), r#"Cmp(Ne, Ident("a"), Ident("b"))"#);
+        assert_eq!(cmp("a is b"), r#"Cmp(Eq, Ident("a"), Ident("b"))"#);
+        assert_eq!(cmp("a >= b"), r#"Cmp(Ge, Ident("a"), Ident("b"))"#);
+        assert_eq!(cmp("a = b"), r#"Cmp(Eq, Ident("a"), Ident("b"))"#);
+    }
+
+    #[test]
+    fn test_cmp_priority_beats_position() {
+        // " = " comes first, but " is greater than " ranks higher, so the line splits there
+        // and the equality stays inside the phrasal term on the left
+        assert_eq!(
+            cmp("count of a = b is greater than c"),
+            r#"Cmp(Gt, CountOf(Cmp(Eq, Ident("a"), Ident("b"))), Ident("c"))"#
+        );
+    }
+
+    #[test]
+    fn test_cmp_ignores_nested_operators() {
+        assert_eq!(
+            cmp(r#""a is b" is "c""#),
+            r#"Cmp(Eq, Str("a is b"), Str("c"))"#
+        );
+        assert_eq!(
+            cmp("(a is greater than b) is c"),
+            r#"Cmp(Eq, Cmp(Gt, Ident("a"), Ident("b")), Ident("c"))"#
+        );
+        assert_eq!(
+            parsed("items[a = b]"),
+            r#"Index(Ident("items"), Cmp(Eq, Ident("a"), Ident("b")))"#
+        );
+        assert_eq!(parsed(r#""x < y""#), r#"Str("x < y")"#);
+    }
+
+    #[test]
+    fn test_arithmetic_chains_group_left_to_right() {
+        assert_eq!(
+            split_operands("a plus b minus c", ADD_OPS),
+            vec![(true, "a"), (false, "b"), (true, "c")]
+        );
+        assert_eq!(
+            parsed("a minus b plus c"),
+            r#"Plus(Minus(Ident("a"), Ident("b")), Ident("c"))"#
+        );
+        assert_eq!(
+            parsed("a plus b times c minus d divided by e"),
+            concat!(
+                r#"Minus(Plus(Ident("a"), Times(Ident("b"), Ident("c"))), "#,
+                r#"DividedBy(Ident("d"), Ident("e")))"#
+            )
+        );
+        assert_eq!(
+            parsed("a - b * c / d"),
+            r#"Minus(Ident("a"), DividedBy(Times(Ident("b"), Ident("c")), Ident("d")))"#
+        );
+    }
+
+    #[test]
+    fn test_split_skips_strings_and_brackets() {
+        assert_eq!(
+            split_operands(r#""x plus y" plus (a minus b)"#, ADD_OPS),
+            vec![(true, r#""x plus y""#), (true, "(a minus b)")]
+        );
+        assert_eq!(
+            split_operands("f(a times b) divided by c", MULT_OPS),
+            vec![(false, "f(a times b)"), (true, "c")]
+        );
+        assert_eq!(
+            split_top_level_multi(r#"a, "b, c" and [d, e]"#, &[",", " and "]),
+            vec!["a", r#""b, c""#, "[d, e]"]
+        );
+        assert_eq!(split_top_level("a,,b,", ","), vec!["a", "", "b"]);
+        assert_eq!(
+            split_once_top_level(r#""a with b" with (c with d) with e"#, " with "),
+            Some((r#""a with b""#, "(c with d) with e"))
+        );
+        assert_eq!(split_once_top_level(r#"x "with""#, "\"with"), None);
+    }
+
+    #[test]
+    fn test_split_keeps_utf8_operands_whole() {
+        assert_eq!(
+            split_operands("café plus ñandú minus 日本", ADD_OPS),
+            vec![(true, "café"), (false, "ñandú"), (true, "日本")]
+        );
+        assert_eq!(
+            split_operands("é times ü divided by ß", MULT_OPS),
+            vec![(true, "é"), (false, "ü"), (true, "ß")]
+        );
+        assert_eq!(
+            split_top_level_multi("α,β and γ", &[",", " and "]),
+            vec!["α", "β", "γ"]
+        );
+        assert_eq!(
+            split_once_top_level(r#""ñ with ñ" with ü"#, " with "),
+            Some((r#""ñ with ñ""#, "ü"))
+        );
+    }
+
+    #[test]
+    fn test_term_number_shapes() {
+        assert_eq!(parsed("-5"), "Num(-5.0)");
+        assert_eq!(parsed("+3"), "Num(3.0)");
+        assert_eq!(parsed(".5"), "Num(0.5)");
+        assert_eq!(parsed("1e3"), "Num(1000.0)");
+        // Number-shaped terms that are not numbers fall through to the later forms
+        assert_eq!(parsed("5x"), r#"Ident("5x")"#);
+        assert!(parse_expr("-x").is_err());
+    }
+
+    #[test]
+    fn test_term_quoted_digits_stay_strings() {
+        assert_eq!(parsed(r#""123""#), r#"Str("123")"#);
+        assert_eq!(parsed(r#""5 apples""#), r#"Str("5 apples")"#);
+        assert_eq!(parsed("'7'"), r#"Str("7")"#);
+    }
+
+    #[test]
+    fn test_term_bare_phrase_keyword_is_identifier() {
+        assert_eq!(parsed("count"), r#"Ident("count")"#);
+        assert_eq!(parsed("size"), r#"Ident("size")"#);
+        assert_eq!(parsed("Make"), r#"Ident("Make")"#);
+        assert_eq!(parsed("count of x"), r#"CountOf(Ident("x"))"#);
+        assert_eq!(
+            parsed("Make a list of 1, 2"),
+            "ListLit([Num(1.0), Num(2.0)])"
+        );
+        assert_eq!(parsed("True"), "Bool(true)");
+        assert_eq!(parsed("nothing"), "Null");
+    }
+}
@@ -1,5 +1,6 @@
 // Centralized phrasal prefixes and helpers
 // Note: Keep ASCII case-insensitive comparisons using eq_ignore_ascii_case.
+// Note: Expression phrases must contain a space; parse_term skips phrase probes for terms without one.
 
 pub const P_TOTAL_OF: &str = "total of ";
 pub const P_SMALLEST_IN: &str = "smallest in ";
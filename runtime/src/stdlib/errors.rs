@@ -138,19 +138,26 @@ impl fmt::Display for PohError {
     }
 }
 
+/// Built-in error type names, matched case-insensitively by `ErrorKind::from_string`
+const BUILTIN_KINDS: &[(&str, ErrorKind)] = &[
+    ("runtimeerror", ErrorKind::RuntimeError),
+    ("typeerror", ErrorKind::TypeError),
+    ("matherror", ErrorKind::MathError),
+    ("fileerror", ErrorKind::FileError),
+    ("jsonerror", ErrorKind::JsonError),
+    ("networkerror", ErrorKind::NetworkError),
+    ("validationerror", ErrorKind::ValidationError),
+];
+
 impl ErrorKind {
     /// Parse an error type string into an ErrorKind
     pub fn from_string(s: &str) -> Self {
-        let lower = s.to_lowercase();
-        match lower.as_str() {
-            "runtimeerror" => ErrorKind::RuntimeError,
-            "typeerror" => ErrorKind::TypeError,
-            "matherror" => ErrorKind::MathError,
-            "fileerror" => ErrorKind::FileError,
-            "jsonerror" => ErrorKind::JsonError,
-            "networkerror" => ErrorKind::NetworkError,
-            "validationerror" => ErrorKind::ValidationError,
-            _ => ErrorKind::Custom(s.to_string()), // Preserve original casing for custom types
+        match BUILTIN_KINDS
+            .iter()
+            .find(|(name, _)| s.eq_ignore_ascii_case(name))
+        {
+            Some((_, kind)) => kind.clone(),
+            None => ErrorKind::Custom(s.to_string()), // Preserve original casing for custom types
         }
     }
 }
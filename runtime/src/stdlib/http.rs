@@ -1,4 +1,5 @@
 use anyhow::{anyhow, Result};
+use once_cell::sync::Lazy;
 use serde_json::{json, Value as JsonValue};
 use std::collections::HashMap;
 use std::fs;
@@ -8,8 +9,8 @@ use std::sync::{Arc, Mutex};
 use std::thread;
 use tiny_http::{Header, Request, Response, Server, StatusCode};
 
-use super::router::{Router, RoutePattern};
 use super::middleware::MiddlewareChain;
+use super::router::{RoutePattern, Router};
 
 /// Represents an HTTP request for PohLang
 #[derive(Debug, Clone)]
@@ -49,6 +50,25 @@ pub struct Route {
     pub path: String,
     pub method: String,
     pub handler: RouteHandler,
+    /// Compiled pattern for paths with parameters (e.g. "/users/:id"), built once at registration
+    pub pattern: Option<RoutePattern>,
+}
+
+impl Route {
+    /// Creates a route, compiling its path pattern up front if it has parameters
+    pub fn new(path: String, method: String, handler: RouteHandler) -> Self {
+        let pattern = if path.contains(':') {
+            RoutePattern::new(&path).ok()
+        } else {
+            None
+        };
+        Self {
+            path,
+            method,
+            handler,
+            pattern,
+        }
+    }
 }
 
 impl std::fmt::Debug for Route {
@@ -83,11 +103,7 @@ impl WebServer {
 
     /// Adds a route to the server
     pub fn add_route(&mut self, path: String, method: String, handler: RouteHandler) {
-        let route = Route {
-            path,
-            method: method.to_uppercase(),
-            handler,
-        };
+        let route = Route::new(path, method.to_uppercase(), handler);
 
         if let Ok(mut routes) = self.routes.lock() {
             routes.push(route);
@@ -263,9 +279,9 @@ fn handle_request(mut request: Request, routes: &Arc<Mutex<Vec<Route>>>) -> Resu
         let mut final_response = error_response(404, "Not Found".to_string());
         
         for route in routes_guard.iter() {
-            // Check if this route has path parameters (contains ':')
-            if route.path.contains(':') && route.method == method {
-                if let Ok(pattern) = RoutePattern::new(&route.path) {
+            // Check if this route has path parameters (pattern compiled at registration)
+            if route.method == method {
+                if let Some(pattern) = &route.pattern {
                     if let Some(params) = pattern.matches(&poh_request.path) {
                         // Found a match! Create request with path params
                         let mut req_with_params = poh_request.clone();
@@ -331,7 +347,7 @@ pub fn html_response(html: String) -> HttpResponse {
 
     // Auto-inject livereload script if HTML contains </body>
     let html_with_reload = if html.contains("</body>") {
-        html.replace("</body>", &format!("{}</body>", LIVERELOAD_SCRIPT))
+        html.replace("</body>", &LIVERELOAD_BODY_CLOSE)
     } else {
         html
     };
@@ -369,6 +385,10 @@ const LIVERELOAD_SCRIPT: &str = r#"
 </script>
 "#;
 
+/// Live reload script followed by the closing body tag it is inserted before,
+/// built once instead of formatted for every HTML response
+static LIVERELOAD_BODY_CLOSE: Lazy<String> = Lazy::new(|| format!("{}</body>", LIVERELOAD_SCRIPT));
+
 /// Helper function to create a JSON response
 pub fn json_response(json: JsonValue) -> HttpResponse {
     let mut headers = HashMap::new();
@@ -563,4 +583,20 @@ mod tests {
         );
         assert!(response.body.contains("success"));
     }
+
+    #[test]
+    fn test_route_pattern_compiled_once() {
+        let handler: RouteHandler = Arc::new(|_req| Ok(html_response(String::new())));
+        let route = Route::new("/users/:id".to_string(), "GET".to_string(), handler.clone());
+        let params = route
+            .pattern
+            .as_ref()
+            .unwrap()
+            .matches("/users/42")
+            .unwrap();
+        assert_eq!(params.get("id").unwrap(), "42");
+
+        let plain = Route::new("/about".to_string(), "GET".to_string(), handler);
+        assert!(plain.pattern.is_none());
+    }
 }
@@ -284,8 +284,10 @@ mod tests {
         let mut req = HttpRequest {
             method: "GET".to_string(),
             path: "/test".to_string(),
+            query: HashMap::new(),
             headers: HashMap::new(),
             body: String::new(),
+            path_params: HashMap::new(),
         };
         
         let mut ctx = MiddlewareContext::new();
@@ -316,8 +318,10 @@ mod tests {
         let mut req = HttpRequest {
             method: "GET".to_string(),
             path: "/test".to_string(),
+            query: HashMap::new(),
             headers: HashMap::new(),
             body: String::new(),
+            path_params: HashMap::new(),
         };
         
         let mut ctx = MiddlewareContext::new();
@@ -335,8 +339,10 @@ mod tests {
         let mut req = HttpRequest {
             method: "GET".to_string(),
             path: "/test".to_string(),
+            query: HashMap::new(),
             headers: HashMap::new(),
             body: String::new(),
+            path_params: HashMap::new(),
         };
         
         let mut ctx = MiddlewareContext::new();
@@ -60,6 +60,11 @@ impl RoutePattern {
     /// Attempts to match a path against this pattern
     /// Returns Some(params) if match, None otherwise
     pub fn matches(&self, path: &str) -> Option<HashMap<String, String>> {
+        // Routes without parameters are literal, so a plain comparison decides the match
+        if self.param_names.is_empty() {
+            return (path == self.pattern).then(HashMap::new);
+        }
+
         let captures = self.regex.captures(path)?;
         
         let mut params = HashMap::new();
@@ -178,7 +183,9 @@ impl Router {
     /// Finds a matching route and extracts path parameters
     pub fn find_route(&self, path: &str, method: &str) -> Option<(&EnhancedRoute, HashMap<String, String>)> {
         for route in &self.routes {
-            if route.method == method.to_uppercase() {
+            // Route methods are stored uppercased; compare in place instead of uppercasing
+            // the request method once per route
+            if route.method.eq_ignore_ascii_case(method) {
                 if let Some(params) = route.pattern.matches(path) {
                     return Some((route, params));
                 }
@@ -298,4 +305,23 @@ mod tests {
         let params = pattern.matches("/static/css/style.css").unwrap();
         assert_eq!(params.get("*"), Some(&"css/style.css".to_string()));
     }
+
+    #[test]
+    fn test_route_pattern_literal_is_exact() {
+        let pattern = RoutePattern::new("/api/v1.0").unwrap();
+        assert!(pattern.matches("/api/v1.0").unwrap().is_empty());
+        assert!(pattern.matches("/api/v1x0").is_none());
+        assert!(pattern.matches("/api/v1.0/").is_none());
+    }
+
+    #[test]
+    fn test_find_route_ignores_method_case() {
+        let mut router = Router::new();
+        let handler: RouteHandler =
+            Arc::new(|_req| Ok(crate::stdlib::http::html_response(String::new())));
+        router.add_route("/users/:id", "get", handler).unwrap();
+        let (_, params) = router.find_route("/users/7", "Get").unwrap();
+        assert_eq!(params.get("id"), Some(&"7".to_string()));
+        assert!(router.find_route("/users/7", "post").is_none());
+    }
 }
@@ -27,59 +27,31 @@ use serde_json::Value as JsonValue;
 /// let rendered = render_template(template, &data)?;
 /// ```
 pub fn render_template(template: &str, data: &JsonValue) -> Result<String> {
-    let mut result = template.to_string();
-
-    // Extract all variables from template
-    let vars = extract_variables(template);
-
-    // Replace each variable with its value from data
-    for var in vars {
-        let placeholder = format!("{{{{{}}}}}", var);
-        let value = get_nested_value(data, &var);
-        result = result.replace(&placeholder, &value);
-    }
-
-    Ok(result)
-}
+    // Single pass: copy the text between placeholders and substitute each {{variable}} as it
+    // is reached, instead of rewriting the whole string once per variable
+    let mut result = String::with_capacity(template.len());
+    let mut rest = template;
+
+    while let Some(open) = rest.find("{{") {
+        let after_open = &rest[open + 2..];
+        let close = match after_open.find("}}") {
+            Some(close) => close,
+            None => break,
+        };
+        let var = &after_open[..close];
 
-/// Extracts variable names from template
-/// Finds all {{variable}} patterns
-fn extract_variables(template: &str) -> Vec<String> {
-    let mut vars = Vec::new();
-    let mut chars = template.chars().peekable();
-
-    while let Some(ch) = chars.next() {
-        if ch == '{' {
-            if let Some(&next) = chars.peek() {
-                if next == '{' {
-                    chars.next(); // consume second {
-
-                    // Read variable name until }}
-                    let mut var_name = String::new();
-                    let mut found_closing = false;
-
-                    while let Some(c) = chars.next() {
-                        if c == '}' {
-                            if let Some(&next_c) = chars.peek() {
-                                if next_c == '}' {
-                                    chars.next(); // consume second }
-                                    found_closing = true;
-                                    break;
-                                }
-                            }
-                        }
-                        var_name.push(c);
-                    }
-
-                    if found_closing {
-                        vars.push(var_name.trim().to_string());
-                    }
-                }
-            }
+        result.push_str(&rest[..open]);
+        if var.trim() == var {
+            result.push_str(&get_nested_value(data, var));
+        } else {
+            // Padded placeholders such as {{ name }} are left as written
+            result.push_str(&rest[open..open + close + 4]);
         }
+        rest = &after_open[close + 2..];
     }
+    result.push_str(rest);
 
-    vars
+    Ok(result)
 }
 
 /// Gets a value from JSON data, supporting nested paths with dot notation
@@ -247,12 +219,11 @@ mod tests {
     }
 
     #[test]
-    fn test_extract_variables() {
+    fn test_variables_within_text() {
         let template = "{{name}} is {{age}} years old";
-        let vars = extract_variables(template);
-        assert_eq!(vars.len(), 2);
-        assert!(vars.contains(&"name".to_string()));
-        assert!(vars.contains(&"age".to_string()));
+        let data = json!({"name": "Ann", "age": 30});
+        let result = render_template(template, &data).unwrap();
+        assert_eq!(result, "Ann is 30 years old");
     }
 
     #[test]
@@ -278,4 +249,12 @@ mod tests {
         let result = render_template(template, &data).unwrap();
         assert_eq!(result, "<p>Active: true</p>");
     }
+
+    #[test]
+    fn test_repeated_and_unclosed_placeholders() {
+        let template = "{{name}} and {{name}}, {{ name }} {{name";
+        let data = json!({"name": "Bob"});
+        let result = render_template(template, &data).unwrap();
+        assert_eq!(result, "Bob and Bob, {{ name }} {{name");
+    }
 }
@@ -295,7 +295,7 @@ impl Vm {
                     let error_type_from_msg = if let Some(start) = err_msg.find('[') {
                         if let Some(end) = err_msg.find(']') {
                             if start < end {
-                                Some(err_msg[start + 1..end].to_string())
+                                Some(&err_msg[start + 1..end])
                             } else {
                                 None
                             }
@@ -306,17 +306,22 @@ impl Vm {
                         None
                     };
 
+                    // Lowered copy of the message for the fallback search, built at most once
+                    let mut err_msg_lower: Option<String> = None;
+
                     // Try to match a catch handler
                     let mut handled = false;
                     for handler in catch_handlers {
                         // Check if error type matches (if specified)
                         let type_matches = if let Some(ref error_type) = handler.error_type {
                             // Match against extracted type marker first, then fallback to message search
-                            if let Some(ref msg_type) = error_type_from_msg {
+                            if let Some(msg_type) = error_type_from_msg {
                                 msg_type.eq_ignore_ascii_case(error_type)
                             } else {
                                 // Fallback: case-insensitive message search
-                                err_msg.to_lowercase().contains(&error_type.to_lowercase())
+                                err_msg_lower
+                                    .get_or_insert_with(|| err_msg.to_lowercase())
+                                    .contains(&error_type.to_lowercase())
                             }
                         } else {
                             true // No type specified = catch all
@@ -556,11 +561,11 @@ impl Vm {
                                 });
 
                                 // Add the route
-                                let route = crate::stdlib::http::Route {
-                                    path: "/__reload_check".to_string(),
-                                    method: "GET".to_string(),
-                                    handler: reload_handler,
-                                };
+                                let route = crate::stdlib::http::Route::new(
+                                    "/__reload_check".to_string(),
+                                    "GET".to_string(),
+                                    reload_handler,
+                                );
 
                                 server_arc.lock().unwrap().add_route_direct(route);
                                 eprintln!("🔄 Hot reload enabled at /__reload_check");
@@ -716,14 +721,7 @@ impl Vm {
                 }
                 Ok(Value::Str(format!("<{}>", name)))
             }
-            Expr::Plus(a, b) => {
-                let sa = self.eval(a)?;
-                let sb = self.eval(b)?;
-                match (sa, sb) {
-                    (Value::Num(na), Value::Num(nb)) => Ok(Value::Num(na + nb)),
-                    (x, y) => Ok(Value::Str(format!("{}{}", to_string(&x), to_string(&y)))),
-                }
-            }
+            Expr::Plus(..) => eval_plus_chain(e, |x| self.eval(x)),
             Expr::Minus(a, b) => {
                 let sa = self.eval(a)?;
                 let sb = self.eval(b)?;
@@ -1774,14 +1772,7 @@ impl Vm {
                 Ok(Value::Str(format!("<{}>", n)))
             }
             Expr::Str(_) | Expr::Num(_) | Expr::Bool(_) | Expr::Null => self.eval(e),
-            Expr::Plus(a, b) => {
-                let sa = self.eval_in_frame(a, frame)?;
-                let sb = self.eval_in_frame(b, frame)?;
-                match (sa, sb) {
-                    (Value::Num(na), Value::Num(nb)) => Ok(Value::Num(na + nb)),
-                    (x, y) => Ok(Value::Str(format!("{}{}", to_string(&x), to_string(&y)))),
-                }
-            }
+            Expr::Plus(..) => eval_plus_chain(e, |x| self.eval_in_frame(x, frame)),
             Expr::Minus(a, b) => {
                 let sa = self.eval_in_frame(a, frame)?;
                 let sb = self.eval_in_frame(b, frame)?;
@@ -2084,14 +2075,7 @@ impl Vm {
                 Ok(Value::Str(format!("<{}>", n)))
             }
             Expr::Str(_) | Expr::Num(_) | Expr::Bool(_) | Expr::Null => self.eval(e),
-            Expr::Plus(a, b) => {
-                let sa = self.eval_in_scope(a, locals)?;
-                let sb = self.eval_in_scope(b, locals)?;
-                match (sa, sb) {
-                    (Value::Num(na), Value::Num(nb)) => Ok(Value::Num(na + nb)),
-                    (x, y) => Ok(Value::Str(format!("{}{}", to_string(&x), to_string(&y)))),
-                }
-            }
+            Expr::Plus(..) => eval_plus_chain(e, |x| self.eval_in_scope(x, locals)),
             Expr::Minus(a, b) => {
                 let sa = self.eval_in_scope(a, locals)?;
                 let sb = self.eval_in_scope(b, locals)?;
@@ -2395,13 +2379,8 @@ impl Vm {
                 Ok(Value::Str(format!("<{}>", n)))
             }
             Expr::Str(_) | Expr::Num(_) | Expr::Bool(_) | Expr::Null => self.eval(e),
-            Expr::Plus(a, b) => {
-                let sa = self.eval_in_scope_with_capture(a, locals, captured)?;
-                let sb = self.eval_in_scope_with_capture(b, locals, captured)?;
-                match (sa, sb) {
-                    (Value::Num(na), Value::Num(nb)) => Ok(Value::Num(na + nb)),
-                    (x, y) => Ok(Value::Str(format!("{}{}", to_string(&x), to_string(&y)))),
-                }
+            Expr::Plus(..) => {
+                eval_plus_chain(e, |x| self.eval_in_scope_with_capture(x, locals, captured))
             }
             Expr::Minus(a, b) => {
                 let sa = self.eval_in_scope_with_capture(a, locals, captured)?;
@@ -3177,6 +3156,42 @@ fn iso_now() -> String {
     format!("{}", now.as_secs())
 }
 
+// `plus` on two values: numeric addition, otherwise string concatenation. A string left
+// operand is extended in place, so a concatenation chain does not re-copy its prefix.
+fn add_values(a: Value, b: Value) -> Value {
+    match (a, b) {
+        (Value::Num(na), Value::Num(nb)) => Value::Num(na + nb),
+        (Value::Str(mut sa), y) => {
+            sa.push_str(&to_string(&y));
+            Value::Str(sa)
+        }
+        (x, y) => Value::Str(format!("{}{}", to_string(&x), to_string(&y))),
+    }
+}
+
+// Evaluate a `plus` expression. The parser builds `a plus b plus c` as a left-deep tree;
+// longer chains are folded left to right instead of recursing down the left spine.
+// Flattening keeps long concatenations from using one stack frame per operand, and lets
+// every step append to a single accumulator string instead of building one per subtree.
+// Each eval variant (global, frame, scope, captured scope) shares this through its closure.
+fn eval_plus_chain(e: &Expr, mut eval: impl FnMut(&Expr) -> Result<Value>) -> Result<Value> {
+    let mut cur = e;
+    let mut rhs = Vec::new();
+    while let Expr::Plus(a, b) = cur {
+        if rhs.is_empty() && !matches!(**a, Expr::Plus(..)) {
+            // Plain `a plus b`: no chain to collect
+            return Ok(add_values(eval(a)?, eval(b)?));
+        }
+        rhs.push(b.as_ref());
+        cur = a;
+    }
+    let mut acc = eval(cur)?;
+    for operand in rhs.into_iter().rev() {
+        acc = add_values(acc, eval(operand)?);
+    }
+    Ok(acc)
+}
+
 fn to_string(v: &Value) -> String {
     match v {
         Value::Str(s) => s.clone(),
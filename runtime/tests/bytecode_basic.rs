@@ -19,7 +19,7 @@ fn test_constant_pool_basic() {
     assert_eq!(idx1, 0);
     assert_eq!(idx2, 1);
     assert_eq!(idx1, idx3); // deduplication works
-    assert_eq!(pool.constants.len(), 2);
+    assert_eq!(pool.len(), 2);
     println!("✓ Constant pool basic test passed");
 }
 
@@ -65,6 +65,7 @@ fn test_all_instruction_variants_have_size() {
         Instruction::JumpIfFalse(0),
         Instruction::JumpIfTrue(0),
         Instruction::Loop(0),
+        Instruction::CountDown(0, 0),
         Instruction::Call(0),
         Instruction::Return,
         Instruction::BuildList(0),
@@ -110,6 +111,6 @@ fn test_constant_types() {
     pool.add_constant(boolean);
     pool.add_constant(null);
 
-    assert_eq!(pool.constants.len(), 4);
+    assert_eq!(pool.len(), 4);
     println!("✓ All constant types work");
 }
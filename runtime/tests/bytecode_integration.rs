@@ -3,7 +3,9 @@
 
 #[cfg(test)]
 mod tests {
-    use pohlang::bytecode::{BytecodeVM, Compiler, Value};
+    use pohlang::bytecode::{
+        BytecodeDeserializer, BytecodeSerializer, BytecodeVM, Compiler, Instruction, Value,
+    };
     use pohlang::parser::ast::{CmpOp, Expr, Stmt};
 
     fn compile_and_run(program: Vec<Stmt>) -> Result<Value, String> {
@@ -230,6 +232,50 @@ mod tests {
         assert_eq!(output, vec!["Pass"]);
     }
 
+    #[test]
+    fn test_repeat_block() {
+        let program = vec![Stmt::RepeatBlock {
+            count: Expr::Num(3.0),
+            body: vec![Stmt::RepeatBlock {
+                count: Expr::Num(2.0),
+                body: vec![Stmt::Write(Expr::Str("tick".to_string()))],
+            }],
+        }];
+
+        let (_, output) = compile_and_run_with_output(program).unwrap();
+        assert_eq!(output.len(), 6);
+
+        let program = vec![Stmt::RepeatBlock {
+            count: Expr::Num(0.0),
+            body: vec![Stmt::Write(Expr::Str("never".to_string()))],
+        }];
+
+        let (_, output) = compile_and_run_with_output(program).unwrap();
+        assert!(output.is_empty());
+    }
+
+    #[test]
+    fn test_repeat_block_serialization_round_trip() {
+        let program = vec![Stmt::RepeatBlock {
+            count: Expr::Num(2.0),
+            body: vec![Stmt::Write(Expr::Str("tick".to_string()))],
+        }];
+        let chunk = Compiler::new().compile(program).unwrap();
+        assert!(chunk
+            .code
+            .iter()
+            .any(|inst| matches!(inst, Instruction::CountDown(_, _))));
+
+        let bytes = BytecodeSerializer::serialize(&chunk).unwrap();
+        let restored = BytecodeDeserializer::deserialize(&bytes).unwrap();
+        assert_eq!(restored.code, chunk.code);
+
+        let mut vm = BytecodeVM::new();
+        vm.load(restored);
+        vm.run().unwrap();
+        assert_eq!(vm.get_output(), vec!["tick", "tick"]);
+    }
+
     #[test]
     fn test_multiple_statements() {
         let program = vec![
@@ -636,3 +636,23 @@ fn test_join_builtin_comprehensive() {
         .stdout(predicates::str::contains("Hello World PohLang"))
         .stdout(predicates::str::contains("1-2-3"));
 }
+
+#[test]
+fn plus_chain_adds_then_concatenates_left_to_right() {
+    let path = write_program(&[
+        "Set s to 1 plus 2 plus \" x \" plus 3 plus 4",
+        "Write s",
+        "Set t to \"\"",
+        "Repeat 3 times",
+        "    Set t to t plus \"ab\" plus 1",
+        "End",
+        "Write t",
+    ]);
+
+    let mut cmd = Command::cargo_bin("pohlang").unwrap();
+    cmd.arg("--run").arg(path.to_str().unwrap());
+    cmd.assert()
+        .success()
+        .stdout(predicates::str::contains("3 x 34"))
+        .stdout(predicates::str::contains("ab1ab1ab1"));
+}